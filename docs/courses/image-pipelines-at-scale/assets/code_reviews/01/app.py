@@ -0,0 +1,11 @@
+from dotenv import load_dotenv
+
+from image_pipeline import create_image_pipeline
+
+load_dotenv()  # Load your environment
+
+# Create the pipeline
+pipeline = create_image_pipeline()
+
+# Run the pipeline
+pipeline.run("a cow")
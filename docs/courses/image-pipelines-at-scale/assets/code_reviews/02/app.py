@@ -0,0 +1,27 @@
+import time
+
+from dotenv import load_dotenv
+
+# Griptape
+from griptape.tasks import PromptImageGenerationTask
+
+from image_cache import CachedImageGenerationDriver
+from image_pipeline import create_image_pipeline
+
+load_dotenv()  # Load your environment
+
+# Create the pipeline
+pipeline = create_image_pipeline()
+
+# Run the pipeline twice with the same topic
+for run in range(2):
+    start = time.perf_counter()
+    pipeline.run("a cow")
+    print(f"Run {run + 1}: {time.perf_counter() - start:.2f}s")
+
+# See how the cache did
+generate_image_task = pipeline.find_task("Generate Image Task")
+if isinstance(generate_image_task, PromptImageGenerationTask):
+    image_driver = generate_image_task.image_generation_driver
+    if isinstance(image_driver, CachedImageGenerationDriver):
+        print(f"Cache hits: {image_driver.hits}, misses: {image_driver.misses}")
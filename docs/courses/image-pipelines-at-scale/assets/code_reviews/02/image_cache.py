@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+
+from attrs import Factory, define, field
+
+# Griptape
+from griptape.artifacts import ImageArtifact
+from griptape.drivers import BaseImageGenerationDriver
+
+
+@define
+class CachedImageGenerationDriver(BaseImageGenerationDriver):
+    """Wraps an Image Generation Driver, and serves repeated prompts from a cache on disk.
+
+    Images are stored by the hash of their content, so the same image is only stored once. Each request
+    points to its image with a small json file, named by the hash of the prompt and the Driver settings.
+
+    Attributes:
+        image_generation_driver: The Driver that generates the image when it isn't in the cache.
+        cache_dir: The directory the cache is stored in.
+        max_bytes: Once the images in the cache add up to more than this, the least recently used are removed.
+        hits: How many requests were served from the cache.
+        misses: How many requests were passed on to the image_generation_driver.
+    """
+
+    image_generation_driver: BaseImageGenerationDriver = field(kw_only=True)
+    model: str = field(
+        default=Factory(lambda self: self.image_generation_driver.model, takes_self=True),
+        kw_only=True,
+    )
+    cache_dir: str = field(kw_only=True)
+    max_bytes: int = field(default=500 * 1024 * 1024, kw_only=True)
+    hits: int = field(default=0, init=False)
+    misses: int = field(default=0, init=False)
+    _entries: Optional[OrderedDict[str, dict]] = field(default=None, init=False)
+    _object_refs: dict[str, int] = field(factory=dict, init=False)
+    _total_bytes: int = field(default=0, init=False)
+    _lock: threading.RLock = field(factory=threading.RLock, init=False)
+
+    @property
+    def keys_dir(self) -> Path:
+        return Path(self.cache_dir, "keys")
+
+    @property
+    def objects_dir(self) -> Path:
+        return Path(self.cache_dir, "objects")
+
+    @property
+    def entries(self) -> OrderedDict[str, dict]:
+        # Read the cache from disk once, oldest first
+        with self._lock:
+            if self._entries is None:
+                self._entries = OrderedDict()
+                key_paths = sorted(self.keys_dir.glob("*.json"), key=lambda path: path.stat().st_mtime)
+
+                for key_path in key_paths:
+                    entry = json.loads(key_path.read_text())
+
+                    if self.object_path(entry).exists():
+                        self.add_entry(key_path.stem, entry)
+
+            return self._entries
+
+    def cache_key(self, prompts: list[str], negative_prompts: Optional[list[str]] = None) -> str:
+        driver = self.image_generation_driver
+        request = {
+            "driver": type(driver).__name__,
+            "model": driver.model,
+            "size": getattr(driver, "image_size", None),
+            "style": getattr(driver, "style", None),
+            "quality": getattr(driver, "quality", None),
+            "prompts": prompts,
+            "negative_prompts": negative_prompts or [],
+        }
+
+        return hashlib.sha256(json.dumps(request, sort_keys=True).encode()).hexdigest()
+
+    def object_path(self, entry: dict) -> Path:
+        digest = entry["sha256"]
+
+        return Path(self.objects_dir, digest[:2], f"{digest}.{entry['format']}")
+
+    def add_entry(self, key: str, entry: dict) -> None:
+        assert self._entries is not None
+
+        self._entries[key] = entry
+        self._object_refs[entry["sha256"]] = self._object_refs.get(entry["sha256"], 0) + 1
+
+        if self._object_refs[entry["sha256"]] == 1:
+            self._total_bytes += entry["bytes"]
+
+    def get(self, key: str) -> Optional[ImageArtifact]:
+        with self._lock:
+            entry = self.entries.get(key)
+
+            if entry is None:
+                return None
+
+            try:
+                value = self.object_path(entry).read_bytes()
+            except FileNotFoundError:
+                # Someone removed the image - treat it as a miss
+                self.remove(key)
+                return None
+
+            # Mark it as the most recently used, in memory and on disk
+            self.entries.move_to_end(key)
+            os.utime(Path(self.keys_dir, f"{key}.json"))
+
+        return ImageArtifact(
+            value, format=entry["format"], width=entry["width"], height=entry["height"], meta=entry["meta"]
+        )
+
+    def put(self, key: str, image: ImageArtifact) -> None:
+        entry = {
+            "sha256": hashlib.sha256(image.value).hexdigest(),
+            "bytes": len(image.value),
+            "format": image.format,
+            "width": image.width,
+            "height": image.height,
+            "meta": image.meta,
+        }
+
+        with self._lock:
+            if key in self.entries:
+                self.remove(key)
+
+            object_path = self.object_path(entry)
+            if not object_path.exists():
+                self.write_atomic(object_path, image.value)
+            self.write_atomic(Path(self.keys_dir, f"{key}.json"), json.dumps(entry).encode())
+
+            self.add_entry(key, entry)
+            self.evict()
+
+    def remove(self, key: str) -> None:
+        with self._lock:
+            entry = self.entries.pop(key)
+            Path(self.keys_dir, f"{key}.json").unlink(missing_ok=True)
+
+            # Only remove the image once no other request points to it
+            self._object_refs[entry["sha256"]] -= 1
+            if self._object_refs[entry["sha256"]] == 0:
+                del self._object_refs[entry["sha256"]]
+                self._total_bytes -= entry["bytes"]
+                self.object_path(entry).unlink(missing_ok=True)
+
+    def evict(self) -> None:
+        # Always keep the newest entry, even if it's bigger than max_bytes on its own
+        while self._total_bytes > self.max_bytes and len(self.entries) > 1:
+            self.remove(next(iter(self.entries)))
+
+    def write_atomic(self, path: Path, value: bytes) -> None:
+        # Write to a temporary file first, so a crash never leaves half an image in the cache
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+        tmp_path.write_bytes(value)
+        os.replace(tmp_path, path)
+
+    def try_text_to_image(self, prompts: list[str], negative_prompts: Optional[list[str]] = None) -> ImageArtifact:
+        key = self.cache_key(prompts, negative_prompts)
+        image = self.get(key)
+
+        if image is not None:
+            with self._lock:
+                self.hits += 1
+            return image
+
+        with self._lock:
+            self.misses += 1
+        image = self.image_generation_driver.try_text_to_image(prompts, negative_prompts)
+        self.put(key, image)
+
+        return image
+
+    def try_image_variation(
+        self,
+        prompts: list[str],
+        image: ImageArtifact,
+        negative_prompts: Optional[list[str]] = None,
+    ) -> ImageArtifact:
+        return self.image_generation_driver.try_image_variation(prompts, image, negative_prompts)
+
+    def try_image_inpainting(
+        self,
+        prompts: list[str],
+        image: ImageArtifact,
+        mask: ImageArtifact,
+        negative_prompts: Optional[list[str]] = None,
+    ) -> ImageArtifact:
+        return self.image_generation_driver.try_image_inpainting(prompts, image, mask, negative_prompts)
+
+    def try_image_outpainting(
+        self,
+        prompts: list[str],
+        image: ImageArtifact,
+        mask: ImageArtifact,
+        negative_prompts: Optional[list[str]] = None,
+    ) -> ImageArtifact:
+        return self.image_generation_driver.try_image_outpainting(prompts, image, mask, negative_prompts)
@@ -0,0 +1,41 @@
+from dotenv import load_dotenv
+
+from batch import BatchImageGenerator
+from image_pipeline import create_image_driver, output_dir, style
+
+load_dotenv()  # Load your environment
+
+topics = [
+    "a cow",
+    "a lighthouse in a storm",
+    "a bowl of ramen",
+    "a vintage motorcycle",
+    "a fox in the snow",
+    "a city skyline at night",
+    "a hot air balloon",
+    "a jazz band",
+    "a sailboat at sunset",
+    "a robot reading a book",
+    "a field of sunflowers",
+    "a steam locomotive",
+]
+
+# Create the batch generator
+generator = BatchImageGenerator(
+    image_generation_driver=create_image_driver(),
+    output_dir=output_dir,
+    style=style,
+    prompt_batch_size=5,
+    max_workers=4,
+    images_per_minute=15,
+)
+
+# Print each image as soon as it's written
+for result in generator.run(topics):
+    if result.error is None:
+        print(f"{result.topic}: {result.image_path}")
+    else:
+        print(f"{result.topic}: failed - {result.error}")
+
+print(f"{generator.image_count} images, {generator.error_count} errors")
+print(f"{generator.measured_images_per_minute:.1f} images/minute")
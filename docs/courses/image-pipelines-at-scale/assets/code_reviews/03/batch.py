@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+import concurrent.futures as futures
+import json
+import os
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from itertools import islice
+from typing import Optional
+
+from attrs import Factory, define, field
+
+# Griptape
+from griptape.artifacts import BaseArtifact, ErrorArtifact, ImageArtifact, TextArtifact
+from griptape.configs import Defaults
+from griptape.drivers import BaseImageGenerationDriver, BasePromptDriver
+from griptape.tasks import PromptImageGenerationTask, PromptTask
+
+
+@define
+class RateLimiter:
+    """Spaces out calls so there are never more than `per_minute` of them in a minute.
+
+    Attributes:
+        per_minute: How many calls are allowed per minute.
+    """
+
+    per_minute: float = field(kw_only=True)
+    _next_time: float = field(default=0.0, init=False)
+    _lock: threading.Lock = field(factory=threading.Lock, init=False)
+
+    def wait(self) -> None:
+        # Reserve the next free slot, then sleep until it arrives
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_time)
+            self._next_time = slot + 60 / self.per_minute
+
+        time.sleep(slot - now)
+
+
+@define
+class BatchResult:
+    """The result of generating the image for one topic.
+
+    Attributes:
+        topic: The topic the image was generated for.
+        prompt: The image generation prompt that was created for the topic.
+        image_path: Where the image was written, or None if it failed.
+        error: The error message, if generating the image failed.
+    """
+
+    topic: str = field(kw_only=True)
+    prompt: str = field(kw_only=True)
+    image_path: Optional[str] = field(default=None, kw_only=True)
+    error: Optional[str] = field(default=None, kw_only=True)
+
+
+@define
+class BatchImageGenerator:
+    """Generates an image for every topic in a list, or in a stream of topics.
+
+    Prompts are created for several topics with a single LLM request. Images are generated in a thread pool,
+    under a rate limit, and each result is returned as soon as its image has been written.
+
+    Attributes:
+        image_generation_driver: The Driver used to generate the images.
+        prompt_driver: The Driver used to create the image generation prompts.
+        output_dir: The directory the images are written to.
+        style: The style every image is created in.
+        prompt_batch_size: How many topics are sent to the LLM in one request.
+        max_workers: How many images are generated at the same time.
+        images_per_minute: The most images to request from the image_generation_driver in a minute.
+        image_count: How many images have been generated so far.
+        error_count: How many images failed.
+        started_at: When the batch started, as returned by `time.monotonic()`.
+    """
+
+    image_generation_driver: BaseImageGenerationDriver = field(kw_only=True)
+    prompt_driver: BasePromptDriver = field(
+        default=Factory(lambda: Defaults.drivers_config.prompt_driver), kw_only=True
+    )
+    output_dir: str = field(kw_only=True)
+    style: str = field(kw_only=True)
+    prompt_batch_size: int = field(default=20, kw_only=True)
+    max_workers: int = field(default=8, kw_only=True)
+    images_per_minute: float = field(default=15, kw_only=True)
+    image_count: int = field(default=0, init=False)
+    error_count: int = field(default=0, init=False)
+    started_at: float = field(default=0.0, init=False)
+    rate_limiter: RateLimiter = field(
+        default=Factory(lambda self: RateLimiter(per_minute=self.images_per_minute), takes_self=True),
+        kw_only=True,
+    )
+
+    @property
+    def measured_images_per_minute(self) -> float:
+        elapsed = time.monotonic() - self.started_at
+
+        return self.image_count / elapsed * 60 if elapsed > 0 else 0.0
+
+    def create_prompt(self, topic: str) -> BaseArtifact:
+        task = PromptTask(
+            """
+            Create a prompt for an Image Generation pipeline for the following topic:
+            {{ topic }}
+            in the style of {{ style }}.
+            """,
+            context={"topic": topic, "style": self.style},
+            prompt_driver=self.prompt_driver,
+        )
+
+        return task.run()
+
+    def create_prompts(self, topics: list[str]) -> list[BaseArtifact]:
+        task = PromptTask(
+            """
+            Create a prompt for an Image Generation pipeline for each of the following topics,
+            in the style of {{ style }}.
+            {% for topic in topics %}
+            {{ loop.index }}. {{ topic }}
+            {% endfor %}
+            Respond with only a JSON array of {{ topics|length }} strings, one prompt per topic, in the same order.
+            """,
+            context={"topics": topics, "style": self.style},
+            prompt_driver=self.prompt_driver,
+        )
+        output = task.run()
+
+        # If the request failed, every topic in the batch gets the error instead of a prompt
+        if isinstance(output, ErrorArtifact):
+            return [output] * len(topics)
+
+        try:
+            prompts = json.loads(output.to_text().strip().removeprefix("```json").strip("`\n "))
+        except json.JSONDecodeError:
+            prompts = None
+
+        # If the LLM didn't return one prompt per topic, create them one at a time instead
+        if not isinstance(prompts, list) or len(prompts) != len(topics):
+            return [self.create_prompt(topic) for topic in topics]
+
+        return [TextArtifact(str(prompt)) for prompt in prompts]
+
+    def generate_image(self, topic: str, prompt_artifact: BaseArtifact) -> BatchResult:
+        # Don't pay for an image of an error message
+        if isinstance(prompt_artifact, ErrorArtifact):
+            return BatchResult(topic=topic, prompt="", error=f"Couldn't create a prompt: {prompt_artifact.value}")
+
+        prompt = prompt_artifact.to_text().strip()
+        self.rate_limiter.wait()
+
+        # Pass the prompt in the context, so anything in it that looks like Jinja isn't treated as a template
+        task = PromptImageGenerationTask(
+            "{{ prompt }}",
+            context={"prompt": prompt},
+            image_generation_driver=self.image_generation_driver,
+            output_dir=self.output_dir,
+        )
+        output = task.run()
+
+        if isinstance(output, ImageArtifact):
+            return BatchResult(topic=topic, prompt=prompt, image_path=os.path.join(self.output_dir, output.name))
+        elif isinstance(output, ErrorArtifact):
+            return BatchResult(topic=topic, prompt=prompt, error=output.value)
+        else:
+            return BatchResult(topic=topic, prompt=prompt, error=f"Unexpected output: {output.to_text()}")
+
+    def run(self, topics: Iterable[str]) -> Iterator[BatchResult]:
+        self.started_at = time.monotonic()
+        self.image_count = 0
+        self.error_count = 0
+
+        topics = iter(topics)
+        not_done: set[futures.Future[BatchResult]] = set()
+
+        with futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while True:
+                # Only read the next batch of topics once there's room for it
+                batch = list(islice(topics, self.prompt_batch_size)) if len(not_done) <= self.max_workers else []
+
+                for topic, prompt in zip(batch, self.create_prompts(batch) if batch else []):
+                    not_done.add(executor.submit(self.generate_image, topic, prompt))
+
+                if not not_done:
+                    break
+
+                done, not_done = futures.wait(not_done, return_when=futures.FIRST_COMPLETED)
+
+                for future in done:
+                    result = future.result()
+
+                    if result.error is None:
+                        self.image_count += 1
+                    else:
+                        self.error_count += 1
+
+                    yield result
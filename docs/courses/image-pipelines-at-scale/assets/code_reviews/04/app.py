@@ -0,0 +1,17 @@
+import os
+import time
+
+from dotenv import load_dotenv
+
+from image_pipeline import create_image_pipeline, output_dir
+
+load_dotenv()  # Load your environment
+
+# Create the pipeline
+pipeline = create_image_pipeline()
+
+# Run the pipeline
+start = time.perf_counter()
+pipeline.run("a cow")
+print(f"Pipeline finished in {time.perf_counter() - start:.2f}s")
+print(f"Gallery: {os.path.abspath(os.path.join(output_dir, 'gallery.html'))}")
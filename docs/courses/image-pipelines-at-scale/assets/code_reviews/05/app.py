@@ -0,0 +1,28 @@
+import os
+
+from dotenv import load_dotenv
+
+from image_pipeline import create_image_pipeline
+
+load_dotenv()  # Load your environment
+
+
+def main() -> None:
+    # Create the pipeline
+    pipeline = create_image_pipeline()
+
+    # Run the pipeline
+    pipeline.run("a cow")
+
+    # Compare the optimized images with the original
+    original = pipeline.find_task("Display Image Task").output
+    if original is not None:
+        print(f"{original.value}: {os.path.getsize(original.value) / 1024:,.0f} KB")
+
+    for variant in pipeline.output.value:
+        print(f"{variant.value}: {variant.meta['bytes'] / 1024:,.0f} KB")
+
+
+# Worker processes import this file too, so only run the pipeline from the main process
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+from dotenv import load_dotenv
+
+from image_pipeline import create_image_pipeline, output_dir
+from perceptual_hash import get_index
+
+load_dotenv()  # Load your environment
+
+
+def main() -> None:
+    # Create the pipeline
+    pipeline = create_image_pipeline()
+
+    # Run the pipeline with two similar topics
+    for topic in ["a cow", "a cow in a field"]:
+        pipeline.run(topic)
+
+        image = pipeline.find_task("Dedupe Image Task").output
+        if image is not None and "duplicate_of" in image.meta:
+            print(f"{topic}: looks like {image.meta['duplicate_of']} (distance {image.meta['distance']})")
+        elif image is not None:
+            print(f"{topic}: new image {image.name}")
+
+    # Look for groups of similar images in everything generated so far
+    for group in get_index(output_dir).find_duplicates():
+        print(f"Similar images: {', '.join(group)}")
+
+
+# Worker processes import this file too, so only run the pipeline from the main process
+if __name__ == "__main__":
+    main()
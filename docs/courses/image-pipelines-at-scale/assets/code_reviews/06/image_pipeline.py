@@ -0,0 +1,86 @@
+import os
+
+# Griptape
+from griptape.drivers import OpenAiImageGenerationDriver
+from griptape.structures import Pipeline
+from griptape.tasks import (
+    CodeExecutionTask,
+    PromptImageGenerationTask,
+    PromptTask,
+)
+
+from display import display_image
+from image_cache import CachedImageGenerationDriver
+from optimize import optimize_image
+from perceptual_hash import dedupe_image
+
+
+# Variables
+output_dir = "images"
+style = "a polaroid photograph from the 1970s"
+
+
+def create_image_driver() -> CachedImageGenerationDriver:
+    # Create the driver, and put a cache in front of it
+    return CachedImageGenerationDriver(
+        image_generation_driver=OpenAiImageGenerationDriver(
+            model="dall-e-3", api_type="open_ai", image_size="1024x1024"
+        ),
+        cache_dir=os.path.join(output_dir, ".cache"),
+        max_bytes=200 * 1024 * 1024,
+    )
+
+
+def create_image_pipeline() -> Pipeline:
+    # Create the driver
+    image_driver = create_image_driver()
+
+    # Create the pipeline object
+    pipeline = Pipeline()
+
+    # Create tasks
+    create_prompt_task = PromptTask(
+        """
+        Create a prompt for an Image Generation pipeline for the following topic: 
+        {{ args[0] }}
+        in the style of {{ style }}.
+        """,
+        context={"style": style},
+        id="Create Prompt Task",
+    )
+
+    generate_image_task = PromptImageGenerationTask(
+        "{{ parent_output }}",
+        image_generation_driver=image_driver,
+        output_dir=output_dir,
+        id="Generate Image Task",
+    )
+
+    dedupe_image_task = CodeExecutionTask(
+        "{{ parent.output.name }}",
+        context={"output_dir": output_dir},
+        on_run=dedupe_image,
+        id="Dedupe Image Task",
+    )
+
+    display_image_task = CodeExecutionTask(
+        "{{ parent.output.name }}",
+        context={"output_dir": output_dir},
+        on_run=display_image,
+        id="Display Image Task",
+    )
+
+    optimize_image_task = CodeExecutionTask(
+        "{{ parent.output.value }}",
+        context={"output_dir": output_dir},
+        on_run=optimize_image,
+        id="Optimize Image Task",
+    )
+
+    # Add tasks to pipeline
+    pipeline.add_tasks(
+        create_prompt_task, generate_image_task, dedupe_image_task, display_image_task, optimize_image_task
+    )
+
+    # Return the pipeline
+    return pipeline
@@ -0,0 +1,252 @@
+from __future__ import annotations
+
+import functools
+import os
+import threading
+from pathlib import Path
+from typing import Optional, Union
+
+import numpy as np
+from attrs import Factory, define, field
+from PIL import Image
+
+# Griptape
+from griptape.artifacts import ImageArtifact
+from griptape.tasks import CodeExecutionTask
+
+# How many bits are set in each possible byte, for NumPy versions without bitwise_count
+POPCOUNT = np.array([bin(byte).count("1") for byte in range(256)], dtype=np.uint8)
+
+
+@functools.cache
+def dct_matrix(size: int) -> np.ndarray:
+    # Row k holds the k-th cosine wave of a discrete cosine transform
+    k = np.arange(size)
+
+    return np.cos(np.pi * k[:, None] * (2 * k[None, :] + 1) / (2 * size))
+
+
+def load_pixels(paths: list[str], width: int, height: int) -> np.ndarray:
+    pixels = np.empty((len(paths), height, width), dtype=np.float32)
+
+    for i, path in enumerate(paths):
+        with Image.open(path) as image:
+            image.draft("L", (width * 4, height * 4))
+            pixels[i] = np.asarray(image.convert("L").resize((width, height), Image.Resampling.BOX))
+
+    return pixels
+
+
+def pack_bits(bits: np.ndarray) -> np.ndarray:
+    # Turn each row of 64 booleans into one 64-bit number
+    return np.packbits(bits, axis=1).view(">u8").ravel().astype(np.uint64)
+
+
+def dhash(pixels: np.ndarray) -> np.ndarray:
+    # Is each pixel brighter than the one to its left? Expects images of 9x8 pixels.
+    return pack_bits((pixels[:, :, 1:] > pixels[:, :, :-1]).reshape(len(pixels), -1))
+
+
+def phash(pixels: np.ndarray) -> np.ndarray:
+    # Keep the 8x8 lowest frequencies of each image, and compare them to their median. Expects 32x32 pixels.
+    dct = dct_matrix(pixels.shape[1])
+    low_frequencies = (dct @ pixels @ dct.T)[:, :8, :8].reshape(len(pixels), -1)
+    median = np.median(low_frequencies[:, 1:], axis=1, keepdims=True)
+
+    return pack_bits(low_frequencies > median)
+
+
+def hash_images(paths: list[str], method: str = "phash") -> np.ndarray:
+    if method == "dhash":
+        return dhash(load_pixels(paths, 9, 8))
+    else:
+        return phash(load_pixels(paths, 32, 32))
+
+
+def hamming_distances(hashes: np.ndarray, other_hashes: np.ndarray) -> np.ndarray:
+    # Compare every hash with every other hash, and count the bits that differ
+    differences = hashes[:, None] ^ other_hashes[None, :]
+
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(differences)
+
+    return POPCOUNT[differences.view(np.uint8).reshape(*differences.shape, 8)].sum(axis=2, dtype=np.uint8)
+
+
+@define
+class PerceptualHashIndex:
+    """Keeps a perceptual hash of every image in a directory, to find images that look alike.
+
+    Similar looking images get hashes that differ in only a few bits, even if their files are completely different.
+
+    Attributes:
+        output_dir: The directory with the images.
+        method: Either 'phash' or 'dhash'.
+        max_distance: How many bits two hashes can differ by, for their images to count as duplicates.
+        index_file: The file the hashes are stored in. One line is appended for each new image.
+        hashes: The hash of every image in the index.
+        paths: The path of every image in the index, in the same order as `hashes`.
+    """
+
+    output_dir: str = field(kw_only=True)
+    method: str = field(default="phash", kw_only=True)
+    max_distance: int = field(default=8, kw_only=True)
+    index_file: str = field(
+        default=Factory(lambda self: os.path.join(self.output_dir, f"{self.method}_index.tsv"), takes_self=True),
+        kw_only=True,
+    )
+    hashes: np.ndarray = field(factory=lambda: np.zeros(0, dtype=np.uint64), init=False)
+    paths: list[str] = field(factory=list, init=False)
+    _known_paths: set[str] = field(factory=set, init=False)
+    _lock: threading.RLock = field(factory=threading.RLock, init=False)
+
+    def __attrs_post_init__(self) -> None:
+        if os.path.exists(self.index_file):
+            with open(self.index_file, encoding="utf-8") as index_file:
+                rows = [line.rstrip("\n").split("\t", 1) for line in index_file if line.strip()]
+
+            self.hashes = np.array([int(image_hash, 16) for image_hash, _ in rows], dtype=np.uint64)
+            self.paths = [path for _, path in rows]
+            self._known_paths = set(self.paths)
+
+    def add(self, paths: list[str], hashes: np.ndarray) -> None:
+        with self._lock:
+            # Skip any images that are already in the index
+            is_new = np.array([path not in self._known_paths for path in paths], dtype=bool)
+            paths = [path for path, new in zip(paths, is_new) if new]
+            hashes = hashes[is_new]
+
+            self._known_paths.update(paths)
+            self.hashes = np.concatenate([self.hashes, hashes])
+            self.paths.extend(paths)
+
+            with open(self.index_file, "a", encoding="utf-8") as index_file:
+                index_file.writelines(f"{int(image_hash):016x}\t{path}\n" for path, image_hash in zip(paths, hashes))
+
+    def remove(self, paths: list[str]) -> None:
+        removed = set(paths)
+
+        with self._lock:
+            if not removed & self._known_paths:
+                return
+
+            keep = np.array([path not in removed for path in self.paths], dtype=bool)
+            self.hashes = self.hashes[keep]
+            self.paths = [path for path, kept in zip(self.paths, keep) if kept]
+            self._known_paths.difference_update(removed)
+
+            # Removing is rare, so it's fine to rewrite the whole file
+            tmp_file = f"{self.index_file}.tmp"
+            with open(tmp_file, "w", encoding="utf-8") as index_file:
+                index_file.writelines(
+                    f"{int(image_hash):016x}\t{path}\n" for path, image_hash in zip(self.paths, self.hashes)
+                )
+            os.replace(tmp_file, self.index_file)
+
+    def update(self, batch_size: int = 256) -> int:
+        # Hash any images in output_dir that aren't in the index yet
+        with self._lock:
+            paths = sorted(str(path) for path in Path(self.output_dir).glob("*.png"))
+            new_paths = [path for path in paths if path not in self._known_paths]
+
+            for start in range(0, len(new_paths), batch_size):
+                batch = new_paths[start : start + batch_size]
+                self.add(batch, hash_images(batch, self.method))
+
+        return len(new_paths)
+
+    def query(self, image: Union[str, int, np.uint64], max_distance: Optional[int] = None) -> list[tuple[str, int]]:
+        image_hash = hash_images([image], self.method)[0] if isinstance(image, str) else np.uint64(image)
+        max_distance = self.max_distance if max_distance is None else max_distance
+
+        with self._lock:
+            distances = hamming_distances(np.array([image_hash], dtype=np.uint64), self.hashes)[0]
+            matches = np.flatnonzero(distances <= max_distance)
+
+            return sorted(((self.paths[i], int(distances[i])) for i in matches), key=lambda match: match[1])
+
+    def find_duplicates(
+        self, max_distance: Optional[int] = None, chunk_bytes: int = 64 * 1024 * 1024
+    ) -> list[list[str]]:
+        max_distance = self.max_distance if max_distance is None else max_distance
+
+        with self._lock:
+            hashes = self.hashes
+            parents = np.arange(len(hashes))
+
+            def find_root(i: int) -> int:
+                while parents[i] != i:
+                    parents[i] = parents[parents[i]]
+                    i = parents[i]
+                return i
+
+            # Compare a chunk of hashes with every later hash, so each pair is only compared once,
+            # and memory stays bounded
+            rows_per_chunk = max(1, chunk_bytes // max(1, len(hashes) * 8))
+
+            for start in range(0, len(hashes), rows_per_chunk):
+                distances = hamming_distances(hashes[start : start + rows_per_chunk], hashes[start:])
+                rows, columns = np.nonzero(distances <= max_distance)
+
+                for row, column in zip(rows, columns):
+                    if row < column:
+                        parents[find_root(row + start)] = find_root(column + start)
+
+            groups: dict[int, list[str]] = {}
+            for i, path in enumerate(self.paths):
+                groups.setdefault(find_root(i), []).append(path)
+
+        return [group for group in groups.values() if len(group) > 1]
+
+
+@functools.cache
+def get_index(output_dir: str) -> PerceptualHashIndex:
+    # One index per directory, brought up to date with any images made before it existed
+    index = PerceptualHashIndex(output_dir=output_dir)
+    index.update()
+
+    return index
+
+
+def dedupe_image(task: CodeExecutionTask) -> ImageArtifact:
+    # Get the image, and its path
+    image = task.parents[0].output
+    output_dir = task.context["output_dir"]
+    image_path = os.path.join(output_dir, task.input.value)
+
+    if not isinstance(image, ImageArtifact):
+        raise ValueError(f"Expected an ImageArtifact, got {type(image).__name__}")
+
+    index = get_index(output_dir)
+    image_hash = hash_images([image_path], index.method)
+    matches = [match for match in index.query(image_hash[0]) if match[0] != image_path]
+
+    if not matches:
+        index.add([image_path], image_hash)
+        return image
+
+    duplicate_path, distance = matches[0]
+    meta = {**image.meta, "duplicate_of": duplicate_path, "distance": distance}
+
+    with Image.open(duplicate_path) as duplicate:
+        width, height = duplicate.size
+
+    if task.context.get("on_duplicate", "skip") == "flag":
+        # Keep the new image, but record what it duplicates
+        index.add([image_path], image_hash)
+        return ImageArtifact(
+            image.value, format=image.format, width=image.width, height=image.height, name=image.name, meta=meta
+        )
+
+    # Remove the new image, and hand on the one we already had
+    index.remove([image_path])
+    os.remove(image_path)
+
+    return ImageArtifact(
+        Path(duplicate_path).read_bytes(),
+        format=image.format,
+        width=width,
+        height=height,
+        name=os.path.relpath(duplicate_path, output_dir),
+        meta=meta,
+    )
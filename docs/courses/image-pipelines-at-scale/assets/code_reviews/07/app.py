@@ -0,0 +1,29 @@
+from dotenv import load_dotenv
+from PIL import Image
+
+from image_file import ImageFileArtifact
+from image_pipeline import create_image_pipeline
+
+load_dotenv()  # Load your environment
+
+
+def main() -> None:
+    # Create the pipeline
+    pipeline = create_image_pipeline()
+
+    # Run the pipeline
+    pipeline.run("a cow")
+
+    # The image is passed through the Pipeline as a path, not as bytes
+    image = pipeline.find_task("Dedupe Image Task").output
+    if isinstance(image, ImageFileArtifact):
+        print(image.to_text())
+
+        # Read the image straight from the file, through a memory map
+        with image.open() as buffer, Image.open(buffer) as pil_image:  # pyright: ignore[reportArgumentType]
+            print(f"Opened {image.name}: {pil_image.size[0]}x{pil_image.size[1]}, {pil_image.mode}")
+
+
+# Worker processes import this file too, so only run the pipeline from the main process
+if __name__ == "__main__":
+    main()
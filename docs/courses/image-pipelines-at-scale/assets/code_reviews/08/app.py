@@ -0,0 +1,35 @@
+import time
+
+from dotenv import load_dotenv
+
+from image_pipeline import create_image_pipeline, prompt_cache
+from prompt_cache import CachedPromptTask
+
+load_dotenv()  # Load your environment
+
+
+def main() -> None:
+    # Create the pipeline
+    pipeline = create_image_pipeline(prompt_variants=3)
+
+    # Create the prompts for a whole catalogue up front
+    create_prompt_task = pipeline.find_task("Create Prompt Task")
+    if isinstance(create_prompt_task, CachedPromptTask):
+        new_topics = create_prompt_task.pre_generate(["a cow", "a lighthouse", "a bowl of ramen"])
+        print(f"Created prompts for {new_topics} new topics")
+
+    # Run the pipeline twice for the same topic
+    for _ in range(2):
+        start = time.perf_counter()
+        pipeline.run("a cow")
+        prompt = create_prompt_task.output
+
+        if prompt is not None:
+            print(f"Variant {prompt.meta['variant']} in {time.perf_counter() - start:.1f}s: {prompt.value}")
+
+    print(f"Prompt cache: {prompt_cache.hits} hits, {prompt_cache.misses} misses")
+
+
+# Worker processes import this file too, so only run the pipeline from the main process
+if __name__ == "__main__":
+    main()
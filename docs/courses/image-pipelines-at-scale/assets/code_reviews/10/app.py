@@ -0,0 +1,37 @@
+import functools
+import time
+
+from dotenv import load_dotenv
+
+from image_pipeline import create_image_driver, create_image_pipeline
+from streaming import StreamingPipeline
+
+load_dotenv()  # Load your environment
+
+topics = [
+    "a cow",
+    "a lighthouse in a storm",
+    "a bowl of ramen",
+    "a vintage motorcycle",
+    "a fox in the snow",
+    "a hot air balloon",
+]
+
+
+def main() -> None:
+    # Every Pipeline shares one image driver, and so one image cache
+    create_pipeline = functools.partial(create_image_pipeline, image_driver=create_image_driver())
+    streaming_pipeline = StreamingPipeline(create_pipeline=create_pipeline, queue_size=2)
+
+    # Print each topic as soon as its last task has run
+    start = time.perf_counter()
+    for topic, pipeline in streaming_pipeline.run(topics):
+        image = pipeline.find_task("Dedupe Image Task").output
+        print(f"{time.perf_counter() - start:5.1f}s  {topic}: {image.to_text() if image else None}")
+
+    print(f"{len(topics)} topics in {time.perf_counter() - start:.1f}s")
+
+
+# Worker processes import this file too, so only run the pipeline from the main process
+if __name__ == "__main__":
+    main()
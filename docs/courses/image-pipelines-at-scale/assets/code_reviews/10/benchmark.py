@@ -0,0 +1,80 @@
+import functools
+import logging
+import os
+import sys
+import threading
+import time
+
+# Griptape
+from griptape.configs import Defaults
+from griptape.events import BaseEvent, EventBus, EventListener, FinishTaskEvent, StartTaskEvent
+
+from image_pipeline import create_image_pipeline
+from local_driver import LocalImageGenerationDriver
+from streaming import StreamingPipeline
+
+# Don't open a viewer for every image, or log every task
+os.environ["IMAGE_PIPELINE_HEADLESS"] = "1"
+logging.getLogger(Defaults.logging_config.logger_name).setLevel(logging.ERROR)
+
+# Pass the number of topics and the latency on the command line, for example: python benchmark.py 100 2.5
+topic_count = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+latency = float(sys.argv[2]) if len(sys.argv) > 2 else 0.5
+
+stage_times: dict[str, list[float]] = {}
+start_times: dict[str, float] = {}
+lock = threading.Lock()
+
+
+def on_event(event: BaseEvent) -> None:
+    # Record how long each task took. The task ids are the stage names.
+    with lock:
+        if isinstance(event, StartTaskEvent):
+            start_times[event.task_id] = event.timestamp
+        elif isinstance(event, FinishTaskEvent):
+            duration = event.timestamp - start_times.pop(event.task_id)
+            stage_times.setdefault(event.task_id, []).append(duration)
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    values = sorted(values)
+
+    return values[min(len(values) - 1, int(fraction * len(values)))]
+
+
+def report(label: str, elapsed: float) -> None:
+    print(f"{label}: {topic_count} images in {elapsed:.1f}s ({topic_count / elapsed * 60:.1f} images per minute)")
+    print(f"{'Stage':<22}{'mean':>8}{'p95':>8}{'total':>9}")
+    for stage, times in stage_times.items():
+        mean = sum(times) / len(times)
+        print(f"{stage:<22}{mean:>7.2f}s{percentile(times, 0.95):>7.2f}s{sum(times):>8.1f}s")
+
+    stage_times.clear()
+
+
+def main() -> None:
+    # Draw the images locally, and use each topic as its prompt, so no API is called
+    image_driver = LocalImageGenerationDriver(latency=latency)
+    create_pipeline = functools.partial(create_image_pipeline, image_driver=image_driver, create_prompts=False)
+    event_listener = EventBus.add_event_listener(EventListener(on_event, event_types=[StartTaskEvent, FinishTaskEvent]))
+
+    # One topic at a time
+    pipeline = create_pipeline()
+    start = time.perf_counter()
+    for index in range(topic_count):
+        pipeline.run(f"sequential topic {index}")
+    report("Sequential", time.perf_counter() - start)
+
+    # Every stage at the same time. The topics are new, so the Dedupe Image Task doesn't find the first run's images.
+    streaming_pipeline = StreamingPipeline(create_pipeline=create_pipeline)
+    start = time.perf_counter()
+    for _ in streaming_pipeline.run(f"streaming topic {index}" for index in range(topic_count)):
+        pass
+    report("Streaming", time.perf_counter() - start)
+
+    EventBus.remove_event_listener(event_listener)
+
+
+# Worker processes import this file too, so only run the benchmark from the main process
+if __name__ == "__main__":
+    main()
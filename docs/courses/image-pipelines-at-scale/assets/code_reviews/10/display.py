@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import hashlib
+import html
+import os
+import re
+import subprocess
+import sys
+import threading
+from pathlib import Path
+
+from PIL import Image
+
+# Griptape
+from griptape.artifacts import TextArtifact
+from griptape.tasks import CodeExecutionTask
+
+THUMBNAIL_SIZE = 256
+GALLERY_HEADER = """<!DOCTYPE html>
+<meta charset="utf-8">
+<title>Image Gallery</title>
+<style>img { width: 256px; height: 256px; object-fit: cover; margin: 4px; }</style>
+"""
+GALLERY_HREF = re.compile(r'<a href="([^"]*)"')
+
+gallery_lock = threading.Lock()
+
+# The image links already in each gallery, read from its file the first time it's used
+gallery_hrefs: dict[str, set[str]] = {}
+
+
+def is_headless() -> bool:
+    # Set IMAGE_PIPELINE_HEADLESS to skip the viewer, for example on a server
+    if os.environ.get("IMAGE_PIPELINE_HEADLESS"):
+        return True
+
+    if sys.platform in ("win32", "darwin"):
+        return False
+
+    # On Linux, there's nowhere to show a window without an X11 or Wayland display
+    return not (os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY"))
+
+
+def create_thumbnail(image_path: str, size: int = THUMBNAIL_SIZE) -> str:
+    image_file = Path(image_path)
+
+    # Name the thumbnail after the image's content, so the same image is only ever shrunk once.
+    # file_digest reads the file in small pieces, instead of loading all of it.
+    with open(image_file, "rb") as f:
+        digest = hashlib.file_digest(f, "sha256").hexdigest()[:16]
+    thumbnail_file = image_file.parent / "thumbnails" / f"{digest}_{size}.jpg"
+
+    if thumbnail_file.exists():
+        return str(thumbnail_file)
+
+    thumbnail_file.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = thumbnail_file.with_name(f"{thumbnail_file.name}.{threading.get_ident()}.tmp")
+
+    with Image.open(image_file) as image:
+        # draft() lets JPEG images decode straight to a smaller size. Other formats ignore it.
+        image.draft("RGB", (size, size))
+        image.thumbnail((size, size), reducing_gap=2.0)
+        image.convert("RGB").save(tmp_file, "JPEG", quality=85)
+
+    os.replace(tmp_file, thumbnail_file)
+
+    return str(thumbnail_file)
+
+
+def add_to_gallery(output_dir: str, image_path: str, thumbnail_path: str, prompt: str) -> str:
+    gallery_path = os.path.join(output_dir, "gallery.html")
+    image_href = Path(os.path.relpath(image_path, output_dir)).as_posix()
+    thumbnail_src = Path(os.path.relpath(thumbnail_path, output_dir)).as_posix()
+
+    href = html.escape(image_href)
+    entry = (
+        f'<a href="{href}" title="{html.escape(prompt)}">'
+        f'<img src="{html.escape(thumbnail_src)}" loading="lazy"></a>\n'
+    )
+
+    # Append one line per image, instead of rewriting the whole page
+    with gallery_lock:
+        is_new = not os.path.exists(gallery_path)
+
+        if is_new or gallery_path not in gallery_hrefs:
+            gallery_hrefs[gallery_path] = (
+                set() if is_new else set(GALLERY_HREF.findall(Path(gallery_path).read_text(encoding="utf-8")))
+            )
+
+        # An image that's displayed again, like a duplicate, is already in the gallery
+        if href in gallery_hrefs[gallery_path]:
+            return gallery_path
+
+        with open(gallery_path, "a", encoding="utf-8") as gallery_file:
+            if is_new:
+                gallery_file.write(GALLERY_HEADER)
+            gallery_file.write(entry)
+
+        gallery_hrefs[gallery_path].add(href)
+
+    return gallery_path
+
+
+def open_in_viewer(path: str) -> None:
+    if sys.platform == "win32":
+        os.startfile(path)  # Returns without waiting for the viewer
+    else:
+        command = "open" if sys.platform == "darwin" else "xdg-open"
+
+        # Start the viewer in its own session, and don't wait for it to close
+        subprocess.Popen(
+            [command, path],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+
+
+def display_image(task: CodeExecutionTask) -> TextArtifact:
+    # Get the path of the image
+    output_dir = task.context["output_dir"]
+    image_path = os.path.join(output_dir, task.input.value)
+
+    # Get the prompt the image was generated from
+    parent_output = task.parents[0].output if task.parents else None
+    prompt = parent_output.meta.get("prompt", "") if parent_output is not None else ""
+
+    # Add a thumbnail to the gallery, then hand the image to the viewer
+    thumbnail_path = create_thumbnail(image_path)
+    add_to_gallery(output_dir, image_path, thumbnail_path, prompt)
+
+    if not task.context.get("headless", is_headless()):
+        open_in_viewer(image_path)
+
+    return TextArtifact(image_path)
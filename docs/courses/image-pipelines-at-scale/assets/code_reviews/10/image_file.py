@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import mmap
+import os
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+from attrs import Factory, define, field
+
+# Griptape
+from griptape.artifacts import BaseArtifact, ImageArtifact
+from griptape.tasks import PromptImageGenerationTask
+
+
+@define
+class ImageFileArtifact(BaseArtifact):
+    """Points to an image in a file, instead of holding the image's bytes in memory.
+
+    Attributes:
+        value: The path of the image file.
+        format: The format of the image data. Used when building the MIME type.
+        width: The width of the image.
+        height: The height of the image.
+        module_name: The module that defines the class. Serialized, so BaseArtifact.from_dict can find it.
+    """
+
+    value: str = field(converter=str, metadata={"serializable": True})
+    format: str = field(kw_only=True, metadata={"serializable": True})
+    width: int = field(kw_only=True, metadata={"serializable": True})
+    height: int = field(kw_only=True, metadata={"serializable": True})
+    module_name: str = field(
+        default=Factory(lambda self: self.__class__.__module__, takes_self=True),
+        kw_only=True,
+        metadata={"serializable": True},
+    )
+
+    def __attrs_post_init__(self) -> None:
+        # Name it after its file, so it can be used wherever an ImageArtifact's name is
+        if self.name == self.id:
+            self.name = os.path.basename(self.value)
+
+    @property
+    def mime_type(self) -> str:
+        return f"image/{self.format}"
+
+    @property
+    def size(self) -> int:
+        return os.path.getsize(self.value)
+
+    def to_text(self) -> str:
+        return f"Image, format: {self.format}, size: {self.size} bytes, path: {self.value}"
+
+    def to_bytes(self) -> bytes:
+        return Path(self.value).read_bytes()
+
+    @contextmanager
+    def open(self) -> Iterator[mmap.mmap]:
+        # Map the file into memory. The operating system only reads the parts that are used.
+        with open(self.value, "rb") as image_file, mmap.mmap(image_file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            yield buffer
+
+    def to_image_artifact(self) -> ImageArtifact:
+        return ImageArtifact(
+            self.to_bytes(), format=self.format, width=self.width, height=self.height, name=self.name, meta=self.meta
+        )
+
+
+@define
+class FileImageGenerationTask(PromptImageGenerationTask):
+    """Generates an image, writes it to output_dir or output_file, and outputs an ImageFileArtifact that points to it.
+
+    The image's bytes are only held in memory until they've been written.
+    """
+
+    def try_run(self) -> ImageFileArtifact:  # pyright: ignore[reportIncompatibleMethodOverride]
+        if not (self.output_dir or self.output_file):
+            raise ValueError("FileImageGenerationTask needs an output_dir or an output_file.")
+
+        image_artifact = self.image_generation_driver.run_text_to_image(
+            prompts=self._get_prompts(self.input.to_text()),
+            negative_prompts=self._get_negative_prompts(),
+        )
+
+        path = self.output_file or os.path.join(str(self.output_dir), image_artifact.name)
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+
+        # Write to a temporary file first, so no one ever sees half an image
+        tmp_path = f"{path}.tmp"
+        Path(tmp_path).write_bytes(image_artifact.value)
+        os.replace(tmp_path, path)
+
+        return ImageFileArtifact(
+            path,
+            format=image_artifact.format,
+            width=image_artifact.width,
+            height=image_artifact.height,
+            meta=image_artifact.meta,
+        )
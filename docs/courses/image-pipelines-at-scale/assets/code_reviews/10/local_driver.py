@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import hashlib
+import io
+import time
+from typing import Optional
+
+import numpy as np
+from attrs import define, field
+from PIL import Image, ImageDraw
+
+# Griptape
+from griptape.artifacts import ImageArtifact
+from griptape.drivers import BaseImageGenerationDriver
+
+
+@define
+class LocalImageGenerationDriver(BaseImageGenerationDriver):
+    """Draws an image from the hash of the prompt, instead of calling an API.
+
+    The same prompt always gets the same image, and the Driver waits `latency` seconds before returning it,
+    to stand in for a real Image Generation Driver in tests and benchmarks.
+
+    Attributes:
+        model: The name reported in the image's metadata.
+        width: The width of every image.
+        height: The height of every image.
+        latency: How many seconds each image takes, like the round trip to an API.
+        jitter: Up to this many extra seconds are added to each image's latency.
+        grain: How much noise is added to each pixel. Noise makes the images compress like photographs.
+    """
+
+    model: str = field(default="local", kw_only=True, metadata={"serializable": True})
+    width: int = field(default=1024, kw_only=True)
+    height: int = field(default=1024, kw_only=True)
+    latency: float = field(default=0.0, kw_only=True)
+    jitter: float = field(default=0.0, kw_only=True)
+    grain: int = field(default=12, kw_only=True)
+
+    def seed(self, *parts: bytes) -> int:
+        # Everything that changes the image goes into the hash
+        digest = hashlib.sha256(b"\0".join([self.model.encode(), *parts])).digest()
+
+        return int.from_bytes(digest[:8], "big")
+
+    def draw(self, seed: int, width: int, height: int) -> Image.Image:
+        rng = np.random.default_rng(seed)
+
+        # A diagonal gradient between two colors
+        start, end = rng.integers(0, 256, size=(2, 3))
+        y, x = np.mgrid[0:height, 0:width]
+        blend = ((x / width + y / height) / 2)[:, :, None]
+        pixels = start + (end - start) * blend
+
+        # Some grain, so the image doesn't compress down to almost nothing
+        if self.grain:
+            pixels = pixels + rng.normal(0, self.grain, size=pixels.shape)
+
+        image = Image.fromarray(pixels.clip(0, 255).astype(np.uint8), "RGB")
+
+        # A few shapes on top
+        draw = ImageDraw.Draw(image)
+        for _ in range(rng.integers(3, 8)):
+            x0, x1 = sorted(rng.integers(0, width, size=2))
+            y0, y1 = sorted(rng.integers(0, height, size=2))
+            color = tuple(int(channel) for channel in rng.integers(0, 256, size=3))
+
+            if rng.random() < 0.5:
+                draw.ellipse((x0, y0, x1, y1), fill=color)
+            else:
+                draw.rectangle((x0, y0, x1, y1), fill=color)
+
+        return image
+
+    def create_image(self, seed: int, prompt: str, width: int, height: int) -> ImageArtifact:
+        # Wait like an API would. The wait is part of the seed too, so every run takes the same time.
+        time.sleep(self.latency + self.jitter * np.random.default_rng(seed).random())
+
+        buffer = io.BytesIO()
+        self.draw(seed, width, height).save(buffer, format="PNG")
+
+        return ImageArtifact(
+            buffer.getvalue(),
+            format="png",
+            width=width,
+            height=height,
+            meta={"model": self.model, "prompt": prompt},
+        )
+
+    def try_text_to_image(self, prompts: list[str], negative_prompts: Optional[list[str]] = None) -> ImageArtifact:
+        prompt = ", ".join(prompts)
+        seed = self.seed(prompt.encode(), ", ".join(negative_prompts or []).encode())
+
+        return self.create_image(seed, prompt, self.width, self.height)
+
+    def try_image_variation(
+        self, prompts: list[str], image: ImageArtifact, negative_prompts: Optional[list[str]] = None
+    ) -> ImageArtifact:
+        seed = self.seed(", ".join(prompts).encode(), image.value)
+
+        return self.create_image(seed, ", ".join(prompts), image.width, image.height)
+
+    def try_image_inpainting(
+        self,
+        prompts: list[str],
+        image: ImageArtifact,
+        mask: ImageArtifact,
+        negative_prompts: Optional[list[str]] = None,
+    ) -> ImageArtifact:
+        seed = self.seed(", ".join(prompts).encode(), image.value, mask.value)
+
+        return self.create_image(seed, ", ".join(prompts), image.width, image.height)
+
+    def try_image_outpainting(
+        self,
+        prompts: list[str],
+        image: ImageArtifact,
+        mask: ImageArtifact,
+        negative_prompts: Optional[list[str]] = None,
+    ) -> ImageArtifact:
+        seed = self.seed(", ".join(prompts).encode(), image.value, mask.value)
+
+        return self.create_image(seed, ", ".join(prompts), image.width, image.height)
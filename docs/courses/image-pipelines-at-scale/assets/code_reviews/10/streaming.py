@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import queue
+import threading
+from collections.abc import Iterable, Iterator
+from typing import Callable, Optional
+
+from attrs import define, field
+
+# Griptape
+from griptape.artifacts import ErrorArtifact
+from griptape.structures import Pipeline
+from griptape.utils import with_contextvars
+
+# Put on a queue after the last input, to tell the next stage there's nothing more to come
+DONE = object()
+
+
+@define
+class StreamingPipeline:
+    """Runs a Pipeline for a stream of inputs, with every task working on a different input at the same time.
+
+    Each task of the Pipeline becomes a stage, with its own thread. A stage hands each input on to the next stage
+    through a bounded queue, and starts on the next input straight away. So while the Generate Image Task works on
+    one topic, the Create Prompt Task is already writing the prompt for the next one.
+
+    Attributes:
+        create_pipeline: Creates the Pipeline for one input. Each input gets its own Pipeline, so the outputs of
+            its tasks don't get mixed up with those of other inputs.
+        queue_size: How many inputs can wait between two stages. When a queue is full, the stage before it waits.
+        stage_names: The ids of the tasks, in order. Filled in by `run`.
+    """
+
+    create_pipeline: Callable[[], Pipeline] = field(kw_only=True)
+    queue_size: int = field(default=2, kw_only=True)
+    stage_names: list[str] = field(factory=list, init=False)
+    _feed_error: Optional[Exception] = field(default=None, init=False)
+
+    def run(self, inputs: Iterable[str]) -> Iterator[tuple[str, Pipeline]]:
+        # Find out what the stages are from a Pipeline we don't run
+        self.stage_names = [task.id for task in self.create_pipeline().tasks]
+        self._feed_error = None
+
+        # One queue in front of every stage, and one for the finished Pipelines
+        queues = [queue.Queue(maxsize=self.queue_size) for _ in range(len(self.stage_names) + 1)]
+        threads = [
+            threading.Thread(target=with_contextvars(self.feed), args=(inputs, queues[0]), daemon=True),
+            *(
+                threading.Thread(
+                    target=with_contextvars(self.run_stage),
+                    args=(index, queues[index], queues[index + 1]),
+                    name=name,
+                    daemon=True,
+                )
+                for index, name in enumerate(self.stage_names)
+            ),
+        ]
+
+        for thread in threads:
+            thread.start()
+
+        # Hand back each input and its Pipeline as soon as the last task has run
+        while (item := queues[-1].get()) is not DONE:
+            yield item
+
+        # DONE only gets here after the feeder has stopped, so any error it had is set by now
+        if self._feed_error is not None:
+            raise self._feed_error
+
+    def feed(self, inputs: Iterable[str], first_queue: queue.Queue) -> None:
+        try:
+            # Read the inputs lazily. When the first stage falls behind, put() waits for it.
+            for pipeline_input in inputs:
+                first_queue.put((pipeline_input, self.create_pipeline()))
+        except Exception as e:
+            # Hand the error to run(), which raises it once the inputs before it are finished
+            self._feed_error = e
+        finally:
+            # Always stop the stages, or run() would wait forever
+            first_queue.put(DONE)
+
+    def run_stage(self, index: int, inbox: queue.Queue, outbox: queue.Queue) -> None:
+        while (item := inbox.get()) is not DONE:
+            pipeline_input, pipeline = item
+            task = pipeline.tasks[index]
+
+            try:
+                if index == 0:
+                    # The same setup that Pipeline.run() does before its first task
+                    pipeline.before_run((pipeline_input,))
+
+                # Skip the rest of the Pipeline once a task has failed, like Pipeline.run() does
+                failed = any(isinstance(earlier.output, ErrorArtifact) for earlier in pipeline.tasks[:index])
+                if not (failed and pipeline.fail_fast):
+                    task.run()
+
+                if index == len(pipeline.tasks) - 1:
+                    pipeline.after_run()
+            except Exception as e:
+                # Never let one input stop the stage, or every input behind it would wait forever
+                task.output = ErrorArtifact(str(e), exception=e)
+
+            outbox.put(item)
+
+        outbox.put(DONE)
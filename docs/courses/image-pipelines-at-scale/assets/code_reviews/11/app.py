@@ -0,0 +1,42 @@
+import functools
+import time
+
+from dotenv import load_dotenv
+
+from gallery_index import get_gallery_index
+from image_pipeline import create_image_driver, create_image_pipeline, output_dir
+from streaming import StreamingPipeline
+
+load_dotenv()  # Load your environment
+
+topics = [
+    "a cow",
+    "a lighthouse in a storm",
+    "a bowl of ramen",
+    "a cow in the snow",
+]
+
+
+def main() -> None:
+    # Every Pipeline shares one image driver, and so one image cache
+    create_pipeline = functools.partial(create_image_pipeline, image_driver=create_image_driver())
+    streaming_pipeline = StreamingPipeline(create_pipeline=create_pipeline, queue_size=2)
+
+    for topic, _ in streaming_pipeline.run(topics):
+        print(f"Finished {topic}")
+
+    # Look images up in the index, instead of listing the directory
+    gallery_index = get_gallery_index(output_dir)
+    print(f"{gallery_index.count()} images in the index")
+
+    for image in gallery_index.newest(limit=3):
+        created_at = time.strftime("%H:%M:%S", time.localtime(image.created_at))
+        print(f"{created_at}  {image.width}x{image.height}  {image.path} -> {image.thumbnail_path}")
+
+    for image in gallery_index.search("cow"):
+        print(f"Found a cow: {image.path} ({image.sha256[:16]})")
+
+
+# Worker processes import this file too, so only run the pipeline from the main process
+if __name__ == "__main__":
+    main()
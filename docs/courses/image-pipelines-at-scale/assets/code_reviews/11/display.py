@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import hashlib
+import html
+import os
+import subprocess
+import sys
+import threading
+from pathlib import Path
+from typing import Optional
+
+from PIL import Image
+
+# Griptape
+from griptape.artifacts import TextArtifact
+from griptape.tasks import CodeExecutionTask
+
+from gallery_index import GalleryImage, get_gallery_index
+from image_file import ImageFileArtifact
+
+THUMBNAIL_SIZE = 256
+GALLERY_HEADER = """<!DOCTYPE html>
+<meta charset="utf-8">
+<title>Image Gallery</title>
+<style>img { width: 256px; height: 256px; object-fit: cover; margin: 4px; }</style>
+"""
+GALLERY_SIZE = 500
+
+gallery_lock = threading.Lock()
+
+
+def is_headless() -> bool:
+    # Set IMAGE_PIPELINE_HEADLESS to skip the viewer, for example on a server
+    if os.environ.get("IMAGE_PIPELINE_HEADLESS"):
+        return True
+
+    if sys.platform in ("win32", "darwin"):
+        return False
+
+    # On Linux, there's nowhere to show a window without an X11 or Wayland display
+    return not (os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY"))
+
+
+def hash_file(path: str) -> str:
+    # file_digest reads the file in small pieces, instead of loading all of it
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def create_thumbnail(image_path: str, size: int = THUMBNAIL_SIZE, digest: Optional[str] = None) -> str:
+    image_file = Path(image_path)
+
+    # Name the thumbnail after the image's content, so the same image is only ever shrunk once
+    digest = digest or hash_file(image_path)
+    thumbnail_file = image_file.parent / "thumbnails" / f"{digest[:16]}_{size}.jpg"
+
+    if thumbnail_file.exists():
+        return str(thumbnail_file)
+
+    thumbnail_file.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = thumbnail_file.with_name(f"{thumbnail_file.name}.{threading.get_ident()}.tmp")
+
+    with Image.open(image_file) as image:
+        # draft() lets JPEG images decode straight to a smaller size. Other formats ignore it.
+        image.draft("RGB", (size, size))
+        image.thumbnail((size, size), reducing_gap=2.0)
+        image.convert("RGB").save(tmp_file, "JPEG", quality=85)
+
+    os.replace(tmp_file, thumbnail_file)
+
+    return str(thumbnail_file)
+
+
+def write_gallery(output_dir: str) -> str:
+    gallery_path = os.path.join(output_dir, "gallery.html")
+    tmp_path = f"{gallery_path}.{threading.get_ident()}.tmp"
+
+    # The index already has every image, newest first, so the page is rebuilt from it instead of read back.
+    # Each image has one row, so an image that's displayed again, like a duplicate, is only shown once.
+    with gallery_lock:
+        images = get_gallery_index(output_dir).newest(limit=GALLERY_SIZE)
+
+        with open(tmp_path, "w", encoding="utf-8") as gallery_file:
+            gallery_file.write(GALLERY_HEADER)
+            for image in images:
+                href = Path(os.path.relpath(image.path, output_dir)).as_posix()
+                thumbnail_src = Path(os.path.relpath(image.thumbnail_path, output_dir)).as_posix()
+                gallery_file.write(
+                    f'<a href="{html.escape(href)}" title="{html.escape(image.prompt)}">'
+                    f'<img src="{html.escape(thumbnail_src)}" loading="lazy"></a>\n'
+                )
+
+        os.replace(tmp_path, gallery_path)
+
+    return gallery_path
+
+
+def open_in_viewer(path: str) -> None:
+    if sys.platform == "win32":
+        os.startfile(path)  # Returns without waiting for the viewer
+    else:
+        command = "open" if sys.platform == "darwin" else "xdg-open"
+
+        # Start the viewer in its own session, and don't wait for it to close
+        subprocess.Popen(
+            [command, path],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+
+
+def display_image(task: CodeExecutionTask) -> TextArtifact:
+    # Get the path of the image
+    output_dir = task.context["output_dir"]
+    image_path = os.path.join(output_dir, task.input.value)
+
+    # Get the prompt the image was generated from
+    parent_output = task.parents[0].output if task.parents else None
+    prompt = parent_output.meta.get("prompt", "") if parent_output is not None else ""
+
+    # Record the image in the gallery index, so it can be found without listing the directory
+    if isinstance(parent_output, ImageFileArtifact):
+        width, height = parent_output.width, parent_output.height
+    else:
+        with Image.open(image_path) as image:
+            width, height = image.size
+
+    digest = hash_file(image_path)
+    get_gallery_index(output_dir).add(
+        GalleryImage(
+            path=image_path,
+            prompt=prompt,
+            style=task.context.get("style", ""),
+            model=parent_output.meta.get("model", "") if parent_output is not None else "",
+            width=width,
+            height=height,
+            sha256=digest,
+            thumbnail_path=create_thumbnail(image_path, digest=digest),
+        )
+    )
+
+    # Show the newest images in the gallery, then hand the image to the viewer
+    write_gallery(output_dir)
+
+    if not task.context.get("headless", is_headless()):
+        open_in_viewer(image_path)
+
+    return TextArtifact(image_path)
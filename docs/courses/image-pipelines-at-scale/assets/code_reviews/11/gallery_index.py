@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import functools
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+from attrs import asdict, define, field
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS images (
+    path TEXT PRIMARY KEY,
+    prompt TEXT NOT NULL,
+    style TEXT NOT NULL,
+    model TEXT NOT NULL,
+    width INTEGER NOT NULL,
+    height INTEGER NOT NULL,
+    sha256 TEXT NOT NULL,
+    thumbnail_path TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS images_by_sha256 ON images (sha256);
+CREATE INDEX IF NOT EXISTS images_by_created_at ON images (created_at, path);
+CREATE INDEX IF NOT EXISTS images_by_style ON images (style, created_at, path);
+"""
+
+
+@define
+class GalleryImage:
+    """One image in the gallery index.
+
+    Attributes:
+        path: The path of the image file.
+        prompt: The prompt the image was generated from.
+        style: The style the prompt was written in.
+        model: The model that generated the image.
+        width: The width of the image.
+        height: The height of the image.
+        sha256: The hash of the image file's content.
+        thumbnail_path: The path of the image's thumbnail.
+        created_at: When the image was added to the index, in seconds since the epoch.
+    """
+
+    path: str = field(kw_only=True)
+    prompt: str = field(kw_only=True)
+    style: str = field(kw_only=True)
+    model: str = field(kw_only=True)
+    width: int = field(kw_only=True)
+    height: int = field(kw_only=True)
+    sha256: str = field(kw_only=True)
+    thumbnail_path: str = field(kw_only=True)
+    created_at: float = field(factory=time.time, kw_only=True)
+
+
+@define
+class GalleryIndex:
+    """Keeps a SQLite database with a row for every image in the gallery.
+
+    Each image is added as soon as it's displayed, so looking up an image never needs to list the directory.
+
+    Attributes:
+        database: The path of the SQLite database file.
+    """
+
+    database: str = field(kw_only=True)
+    _connection: Optional[sqlite3.Connection] = field(default=None, init=False)
+    _lock: threading.Lock = field(factory=threading.Lock, init=False)
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        # Open the database once, and share the connection between threads behind the lock
+        if self._connection is None:
+            self._connection = sqlite3.connect(self.database, check_same_thread=False)
+            self._connection.row_factory = sqlite3.Row
+
+            # Write-ahead logging lets readers carry on while an image is being added
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.executescript(SCHEMA)
+
+        return self._connection
+
+    def add(self, image: GalleryImage) -> None:
+        with self._lock, self.connection:
+            # Adding an image that's already in the index updates its row, but keeps the prompt and style it was
+            # generated from. A duplicate is added again with the newer prompt, which didn't create the file.
+            self.connection.execute(
+                """
+                INSERT INTO images VALUES (
+                    :path, :prompt, :style, :model, :width, :height, :sha256, :thumbnail_path, :created_at
+                )
+                ON CONFLICT (path) DO UPDATE SET
+                    model = excluded.model,
+                    width = excluded.width,
+                    height = excluded.height,
+                    sha256 = excluded.sha256,
+                    thumbnail_path = excluded.thumbnail_path
+                """,
+                asdict(image),
+            )
+
+    def remove(self, path: str) -> None:
+        with self._lock, self.connection:
+            self.connection.execute("DELETE FROM images WHERE path = ?", (path,))
+
+    def query(self, sql: str, parameters: tuple = ()) -> list[GalleryImage]:
+        with self._lock:
+            rows = self.connection.execute(sql, parameters).fetchall()
+
+        return [GalleryImage(**dict(row)) for row in rows]
+
+    def get(self, path: str) -> Optional[GalleryImage]:
+        images = self.query("SELECT * FROM images WHERE path = ?", (path,))
+
+        return images[0] if images else None
+
+    def find_by_hash(self, sha256: str) -> list[GalleryImage]:
+        return self.query("SELECT * FROM images WHERE sha256 = ?", (sha256,))
+
+    def newest(
+        self, limit: int = 100, before: Optional[tuple[float, str]] = None, style: Optional[str] = None
+    ) -> list[GalleryImage]:
+        # Page through the gallery newest first. Pass the (created_at, path) of the last image to get the next page.
+        # The path breaks ties, so images added at the same moment are never skipped or repeated.
+        conditions = []
+        parameters: list = []
+        if style is not None:
+            conditions.append("style = ?")
+            parameters.append(style)
+        if before is not None:
+            conditions.append("(created_at, path) < (?, ?)")
+            parameters.extend(before)
+
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        sql = f"SELECT * FROM images {where} ORDER BY created_at DESC, path DESC LIMIT ?"
+
+        return self.query(sql, (*parameters, limit))
+
+    def search(self, text: str, limit: int = 100) -> list[GalleryImage]:
+        # Reads every row, but never touches the image files themselves
+        return self.query(
+            "SELECT * FROM images WHERE prompt LIKE ? ORDER BY created_at DESC LIMIT ?", (f"%{text}%", limit)
+        )
+
+    def count(self) -> int:
+        with self._lock:
+            return self.connection.execute("SELECT COUNT(*) FROM images").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+@functools.cache
+def get_gallery_index(output_dir: str) -> GalleryIndex:
+    # One index per directory, shared by every Pipeline
+    os.makedirs(output_dir, exist_ok=True)
+
+    return GalleryIndex(database=os.path.join(output_dir, "gallery.db"))
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import atexit
+import concurrent.futures as futures
+import functools
+import multiprocessing
+import os
+from pathlib import Path
+
+from PIL import Image, ImageOps, features
+
+# Griptape
+from griptape.artifacts import ListArtifact, TextArtifact
+from griptape.tasks import CodeExecutionTask
+
+# Pillow can only save AVIF from version 11.2, so older versions only create WebP
+FORMATS = ["webp", "avif"] if "avif" in features.get_supported_modules() else ["webp"]
+WIDTHS = [1024, 512, 256]
+QUALITY = {"webp": 80, "avif": 60}
+
+
+@functools.cache
+def get_executor() -> futures.ProcessPoolExecutor:
+    # One pool of worker processes, shared by every image, and shut down when Python exits
+    executor = futures.ProcessPoolExecutor(mp_context=multiprocessing.get_context("spawn"))
+    atexit.register(executor.shutdown)
+
+    return executor
+
+
+def encode_variant(image_path: str, variant_path: str, image_format: str, width: int, quality: int) -> int:
+    with Image.open(image_path) as source:
+        # Apply any EXIF rotation, before the EXIF data is dropped
+        image = ImageOps.exif_transpose(source)
+
+        if image.width > width:
+            height = round(image.height * width / image.width)
+            image = image.resize((width, height), Image.Resampling.LANCZOS, reducing_gap=3.0)
+
+        # Strip the metadata, so only the pixels are saved
+        image.info = {}
+
+        save_options = {"webp": {"method": 6}, "avif": {"speed": 6}}[image_format]
+        tmp_path = f"{variant_path}.{os.getpid()}.tmp"
+        image.save(tmp_path, format=image_format.upper(), quality=quality, **save_options)
+
+    os.replace(tmp_path, variant_path)
+
+    return os.path.getsize(variant_path)
+
+
+def create_variants(
+    image_path: str,
+    output_dir: str,
+    formats: list[str] = FORMATS,
+    widths: list[int] = WIDTHS,
+    quality: dict[str, int] = QUALITY,
+) -> list[tuple[str, int]]:
+    Path(output_dir).mkdir(parents=True, exist_ok=True)
+    stem = Path(image_path).stem
+
+    # Encode every format and width in its own worker process
+    jobs = {}
+    for image_format in formats:
+        for width in widths:
+            variant_path = os.path.join(output_dir, f"{stem}-{width}w.{image_format}")
+            job = get_executor().submit(
+                encode_variant, image_path, variant_path, image_format, width, quality[image_format]
+            )
+            jobs[job] = variant_path
+
+    return [(jobs[job], job.result()) for job in jobs]
+
+
+def optimize_image(task: CodeExecutionTask) -> ListArtifact:
+    # Get the path of the image
+    image_path = task.input.value
+    output_dir = os.path.join(task.context["output_dir"], "optimized")
+
+    variants = create_variants(
+        image_path,
+        output_dir,
+        formats=task.context.get("formats", FORMATS),
+        widths=task.context.get("widths", WIDTHS),
+        quality=task.context.get("quality", QUALITY),
+    )
+
+    return ListArtifact([TextArtifact(path, meta={"bytes": size}) for path, size in variants])
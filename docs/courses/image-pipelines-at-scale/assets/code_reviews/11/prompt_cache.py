@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import random
+import threading
+from pathlib import Path
+
+from attrs import define, field
+
+# Griptape
+from griptape.artifacts import ErrorArtifact, TextArtifact
+from griptape.tasks import PromptTask
+from griptape.utils import J2
+
+
+@define
+class PromptCache:
+    """Stores the image generation prompts created for each topic, in a directory of small json files.
+
+    Each file is named by the hash of the topic, the style and the model that wrote the prompts, and holds
+    every variant created for them so far.
+
+    Attributes:
+        cache_dir: The directory the prompts are stored in.
+        hits: How many requests were served from the cache.
+        misses: How many requests needed new prompts from the LLM.
+    """
+
+    cache_dir: str = field(kw_only=True)
+    hits: int = field(default=0, init=False)
+    misses: int = field(default=0, init=False)
+    _lock: threading.Lock = field(factory=threading.Lock, init=False)
+
+    def cache_key(self, topic: str, style: str, model: str) -> str:
+        # Ignore case and extra spaces, so "A cow" and "a  cow" share their prompts
+        request = {"topic": " ".join(topic.lower().split()), "style": style, "model": model}
+
+        return hashlib.sha256(json.dumps(request, sort_keys=True).encode()).hexdigest()
+
+    def path(self, key: str) -> Path:
+        return Path(self.cache_dir, key[:2], f"{key}.json")
+
+    def get(self, key: str) -> list[str]:
+        try:
+            return json.loads(self.path(key).read_text(encoding="utf-8"))["prompts"]
+        except FileNotFoundError:
+            return []
+
+    def put(self, key: str, prompts: list[str]) -> None:
+        path = self.path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Write to a temporary file first, so no one ever reads half a file
+        tmp_path = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+        tmp_path.write_text(json.dumps({"prompts": prompts}), encoding="utf-8")
+        os.replace(tmp_path, path)
+
+    def record(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+
+@define
+class CachedPromptTask(PromptTask):
+    """A PromptTask that creates image generation prompts, and remembers them by topic, style and model.
+
+    The first time a topic is seen, the LLM writes `variants` prompts for it in a single request. After that,
+    every run for the topic picks one of the stored prompts, without calling the LLM at all.
+
+    Attributes:
+        prompt_cache: Where the prompts are stored.
+        variants: How many different prompts to create for each topic.
+    """
+
+    prompt_cache: PromptCache = field(kw_only=True)
+    variants: int = field(default=1, kw_only=True)
+
+    def try_run(self) -> TextArtifact:
+        topic = self.full_context["args"][0]
+        prompts = self.get_prompts(topic)
+        variant = random.randrange(len(prompts))
+
+        return TextArtifact(prompts[variant], meta={"topic": topic, "variant": variant})
+
+    def pre_generate(self, topics: list[str]) -> int:
+        # Create the prompts for a whole catalogue of topics ahead of time. Returns how many topics were new.
+        misses = self.prompt_cache.misses
+
+        for topic in topics:
+            self.get_prompts(topic)
+
+        return self.prompt_cache.misses - misses
+
+    def get_prompts(self, topic: str) -> list[str]:
+        style = self.full_context.get("style", "")
+        key = self.prompt_cache.cache_key(topic, style, self.prompt_driver.model)
+        prompts = self.prompt_cache.get(key)
+
+        self.prompt_cache.record(hit=len(prompts) >= self.variants)
+
+        if len(prompts) < self.variants:
+            prompts = prompts + self.create_prompts(topic, self.variants - len(prompts))
+            self.prompt_cache.put(key, prompts)
+
+        return prompts
+
+    def create_prompts(self, topic: str, count: int) -> list[str]:
+        if not isinstance(self._input, str):
+            raise ValueError("CachedPromptTask needs its input to be a template string.")
+
+        # Render the task's own template for this topic
+        request = J2().render_from_string(self._input, **{**self.full_context, "args": [topic]})
+
+        if count == 1:
+            return [self.create_prompt(request)]
+
+        # Ask for all the variants in a single request
+        output = self.create_prompt(
+            f"{request}\nCreate {count} different prompts. Respond with only a JSON array of {count} strings."
+        )
+
+        try:
+            prompts = json.loads(output.removeprefix("```json").strip("`\n "))
+        except json.JSONDecodeError:
+            prompts = None
+
+        prompts = [str(prompt) for prompt in prompts[:count]] if isinstance(prompts, list) else []
+
+        # If the LLM didn't return enough prompts, create the rest one at a time
+        return prompts + [self.create_prompt(request) for _ in range(count - len(prompts))]
+
+    def create_prompt(self, request: str) -> str:
+        task = PromptTask(request, prompt_driver=self.prompt_driver, rules=self.rules)
+        output = task.run()
+
+        # Raise instead of returning the error's message, so a failed request is never cached as a prompt
+        if isinstance(output, ErrorArtifact):
+            raise RuntimeError(f"Couldn't create a prompt: {output.value}") from output.exception
+
+        return output.to_text().strip()
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import concurrent.futures as futures
+import hashlib
+import os
+import re
+
+from attrs import define, field
+
+# Griptape
+from griptape.artifacts import BaseArtifact, ErrorArtifact
+from griptape.common import observable
+from griptape.structures import Workflow
+from griptape.tasks import BaseTask
+from griptape.utils import with_contextvars
+
+
+@define
+class CheckpointedWorkflow(Workflow):
+    """A Workflow that saves the output of every finished task to disk.
+
+    When the Workflow is run again, any task whose rendered input hasn't changed is
+    restored from its checkpoint instead of being run.
+
+    Attributes:
+        checkpoint_dir: The directory the task checkpoints are written to.
+        restored_task_ids: The ids of the tasks restored from a checkpoint during the last run.
+    """
+
+    checkpoint_dir: str = field(default="checkpoints", kw_only=True)
+    restored_task_ids: list[str] = field(factory=list, init=False)
+
+    def input_hash(self, task: BaseTask) -> str:
+        # The rendered input includes the parent outputs, so a change upstream
+        # will also change the hash of every task downstream of it.
+        task_input = f"{task.__class__.__name__}:{task.input.to_text()}"
+
+        return hashlib.sha256(task_input.encode()).hexdigest()
+
+    def checkpoint_path(self, task: BaseTask) -> str:
+        # Task ids like "MOVIE:A_boy_disc" aren't always safe file names
+        safe_id = re.sub(r"[^\w.-]", "_", task.id)
+
+        return os.path.join(self.checkpoint_dir, f"{safe_id}-{self.input_hash(task)}.json")
+
+    def restore_task(self, task: BaseTask, path: str) -> None:
+        with open(path) as file:
+            task.output = BaseArtifact.from_json(file.read())
+        task.state = BaseTask.State.FINISHED
+
+        self.restored_task_ids.append(task.id)
+
+    def save_task(self, task: BaseTask, path: str) -> None:
+        if task.output is None or isinstance(task.output, ErrorArtifact):
+            return
+
+        # Write to a temporary file first so a crash never leaves half a checkpoint behind
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "w") as file:
+            file.write(task.output.to_json())
+        os.replace(temp_path, path)
+
+    @observable
+    def try_run(self, *args) -> Workflow:
+        os.makedirs(self.checkpoint_dir, exist_ok=True)
+        self.restored_task_ids.clear()
+        exit_loop = False
+
+        while not self.is_finished() and not exit_loop:
+            futures_list = {}
+            ordered_tasks = self.order_tasks()
+
+            for task in ordered_tasks:
+                if task.can_run():
+                    path = self.checkpoint_path(task)
+
+                    # Restore the task instead of running it if we've seen this input before
+                    if os.path.exists(path):
+                        self.restore_task(task, path)
+                        continue
+
+                    future = self.futures_executor.submit(with_contextvars(task.run))
+                    futures_list[future] = (task, path)
+
+            # Wait for all tasks to complete, saving each one as it finishes
+            for future in futures.as_completed(futures_list):
+                task, path = futures_list[future]
+
+                if isinstance(future.result(), ErrorArtifact) and self.fail_fast:
+                    exit_loop = True
+
+                    break
+
+                self.save_task(task, path)
+
+        return self
@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import concurrent.futures as futures
+import heapq
+import json
+import os
+import time
+from typing import Callable
+
+from attrs import define, field
+
+# Griptape
+from griptape.artifacts import BaseArtifact, ErrorArtifact
+from griptape.common import observable
+from griptape.structures import Workflow
+from griptape.tasks import BaseTask
+from griptape.utils import with_contextvars
+
+
+@define
+class CriticalPathWorkflow(Workflow):
+    """A Workflow that starts the tasks on the longest remaining path first.
+
+    Task latencies from previous runs are stored in `latency_file` and used to estimate
+    how long each path through the Workflow will take.
+
+    Attributes:
+        latency_file: The JSON file the per-task latency history is stored in.
+        max_workers: The maximum number of tasks to run at the same time.
+        default_latency: The latency, in seconds, assumed for tasks that have never run.
+        smoothing: How much weight the latest run gets when updating the latency history.
+    """
+
+    latency_file: str = field(default="task_latencies.json", kw_only=True)
+    max_workers: int = field(default=4, kw_only=True)
+    default_latency: float = field(default=1.0, kw_only=True)
+    smoothing: float = field(default=0.5, kw_only=True)
+    latencies: dict[str, float] = field(factory=dict, init=False)
+
+    def load_latencies(self) -> None:
+        if os.path.exists(self.latency_file):
+            with open(self.latency_file) as file:
+                self.latencies = json.load(file)
+
+    def save_latencies(self) -> None:
+        with open(self.latency_file, "w") as file:
+            json.dump(self.latencies, file, indent=2)
+
+    def record_latency(self, task: BaseTask, seconds: float) -> None:
+        # Blend the new measurement into the history so one slow run doesn't dominate
+        previous = self.latencies.get(task.id)
+        if previous is None:
+            self.latencies[task.id] = seconds
+        else:
+            self.latencies[task.id] = self.smoothing * seconds + (1 - self.smoothing) * previous
+
+    def estimate_latency(self, task: BaseTask) -> float:
+        return self.latencies.get(task.id, self.default_latency)
+
+    def child_ids_by_task(self) -> dict[str, list[str]]:
+        """Maps every task id to the ids of its children.
+
+        Tasks can be linked with parent_ids, child_ids or both, and the Workflow only fills in the other side
+        when it runs, so both are read here.
+        """
+        # Dicts keep their insertion order, so they're used as ordered sets
+        children: dict[str, dict[str, None]] = {task.id: {} for task in self.tasks}
+        for task in self.tasks:
+            children[task.id].update(dict.fromkeys(task.child_ids))
+            for parent_id in task.parent_ids:
+                children[parent_id][task.id] = None
+
+        return {task_id: list(child_ids) for task_id, child_ids in children.items()}
+
+    def count_parents(self, children: dict[str, list[str]]) -> dict[str, int]:
+        counts = dict.fromkeys(children, 0)
+        for child_ids in children.values():
+            for child_id in child_ids:
+                counts[child_id] += 1
+
+        return counts
+
+    def remaining_path_lengths(self) -> dict[str, float]:
+        """Estimates, for every task, the time from when it starts until the Workflow can finish.
+
+        This is the task's own latency plus the longest remaining path through any of its children.
+        """
+        if not self.latencies:
+            self.load_latencies()
+        children = self.child_ids_by_task()
+        task_by_id = {task.id: task for task in self.tasks}
+
+        # Sort the tasks parents-first, by counting down each child's parents as its parents are added.
+        # Workflow.order_tasks() finds every task by searching a list, which is too slow for thousands of tasks.
+        parent_counts = self.count_parents(children)
+        order = [task_id for task_id, count in parent_counts.items() if count == 0]
+        for task_id in order:  # Children are appended to order while it's being walked
+            for child_id in children[task_id]:
+                parent_counts[child_id] -= 1
+                if parent_counts[child_id] == 0:
+                    order.append(child_id)
+
+        lengths: dict[str, float] = {}
+
+        # Walk from the output tasks back up to the input tasks so children are always computed first
+        for task_id in reversed(order):
+            longest_child = max((lengths[child_id] for child_id in children[task_id]), default=0.0)
+            lengths[task_id] = self.estimate_latency(task_by_id[task_id]) + longest_child
+
+        return lengths
+
+    def critical_path(self) -> list[BaseTask]:
+        children = self.child_ids_by_task()
+        lengths = self.remaining_path_lengths()
+        task_by_id = {task.id: task for task in self.tasks}
+        input_ids = [task_id for task_id, count in self.count_parents(children).items() if count == 0]
+        path = []
+
+        task_id = max(input_ids, key=lambda input_id: lengths[input_id], default=None)
+        while task_id is not None:
+            path.append(task_by_id[task_id])
+            task_id = max(children[task_id], key=lambda child_id: lengths[child_id], default=None)
+
+        return path
+
+    def timed_run(self, task: BaseTask) -> Callable[[], BaseArtifact]:
+        def run() -> BaseArtifact:
+            start_time = time.perf_counter()
+            output = task.run()
+            self.record_latency(task, time.perf_counter() - start_time)
+
+            return output
+
+        return run
+
+    @observable
+    def try_run(self, *args) -> Workflow:
+        children = self.child_ids_by_task()
+        lengths = self.remaining_path_lengths()
+        order = {task.id: index for index, task in enumerate(self.tasks)}
+        task_by_id = {task.id: task for task in self.tasks}
+
+        # How many unfinished parents each task is still waiting for
+        waiting_on = self.count_parents(children)
+
+        # A heap of (-remaining path length, insertion order, task id), so the longest path pops first
+        ready = [(-lengths[task_id], order[task_id], task_id) for task_id, count in waiting_on.items() if count == 0]
+        heapq.heapify(ready)
+        running: dict[futures.Future, BaseTask] = {}
+
+        while ready or running:
+            # Fill the free worker slots with the most critical tasks
+            while ready and len(running) < self.max_workers:
+                _, _, task_id = heapq.heappop(ready)
+                task = task_by_id[task_id]
+                running[self.futures_executor.submit(with_contextvars(self.timed_run(task)))] = task
+
+            # Wait for the first task to finish rather than the whole batch
+            done, _ = futures.wait(running, return_when=futures.FIRST_COMPLETED)
+            for future in done:
+                task = running.pop(future)
+
+                if isinstance(future.result(), ErrorArtifact) and self.fail_fast:
+                    futures.wait(running)
+                    self.save_latencies()
+
+                    return self
+
+                # Only the children of the task that finished can have become ready
+                for child_id in children[task.id]:
+                    waiting_on[child_id] -= 1
+                    if waiting_on[child_id] == 0:
+                        heapq.heappush(ready, (-lengths[child_id], order[child_id], child_id))
+
+        self.save_latencies()
+
+        return self
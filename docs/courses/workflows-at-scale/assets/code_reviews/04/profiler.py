@@ -0,0 +1,294 @@
+from __future__ import annotations
+
+import html
+import json
+import threading
+import time
+from typing import Any, Optional
+
+from attrs import define, field
+
+# Griptape
+from griptape.events import (
+    BaseEvent,
+    EventBus,
+    EventListener,
+    FinishActionsSubtaskEvent,
+    FinishPromptEvent,
+    FinishTaskEvent,
+    StartActionsSubtaskEvent,
+    StartPromptEvent,
+    StartTaskEvent,
+)
+
+
+@define
+class Span:
+    """A single block of time on the timeline.
+
+    Attributes:
+        name: The label shown for the span.
+        category: One of "task", "tool" or "prompt".
+        thread: The name of the thread the span ran on.
+        start: When the span started, in seconds since the epoch.
+        end: When the span ended, in seconds since the epoch.
+        task_id: The id of the Workflow task the span belongs to.
+        parent_ids: For task spans, the ids of the task's parents.
+    """
+
+    name: str = field()
+    category: str = field()
+    thread: str = field()
+    start: float = field()
+    end: Optional[float] = field(default=None)
+    task_id: Optional[str] = field(default=None)
+    parent_ids: list[str] = field(factory=list)
+
+    @property
+    def duration(self) -> float:
+        return (self.end or self.start) - self.start
+
+
+@define
+class WorkflowProfiler:
+    """Records a timeline of a Workflow run by listening to Griptape events.
+
+    Use it as a context manager around `workflow.run()`, then export the timeline with
+    `save_chrome_trace()` or `save_html()`.
+    """
+
+    spans: list[Span] = field(factory=list, init=False)
+    started_at: float = field(default=0.0, init=False)
+    finished_at: float = field(default=0.0, init=False)
+    _open_spans: dict[Any, Span] = field(factory=dict, init=False)
+    _lock: threading.Lock = field(factory=threading.Lock, init=False)
+    _event_listener: Optional[EventListener] = field(default=None, init=False)
+
+    def __enter__(self) -> WorkflowProfiler:
+        self.spans.clear()
+        self.started_at = time.time()
+        self._event_listener = EventBus.add_event_listener(
+            EventListener(
+                self.on_event,
+                event_types=[
+                    StartTaskEvent,
+                    FinishTaskEvent,
+                    StartActionsSubtaskEvent,
+                    FinishActionsSubtaskEvent,
+                    StartPromptEvent,
+                    FinishPromptEvent,
+                ],
+            )
+        )
+
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.finished_at = time.time()
+        if self._event_listener is not None:
+            EventBus.remove_event_listener(self._event_listener)
+
+    def on_event(self, event: BaseEvent) -> None:
+        thread = threading.current_thread().name
+
+        with self._lock:
+            if isinstance(event, StartTaskEvent):
+                self._open_spans[event.task_id] = Span(
+                    event.task_id,
+                    "task",
+                    thread,
+                    event.timestamp,
+                    task_id=event.task_id,
+                    parent_ids=list(event.task_parent_ids),
+                )
+            elif isinstance(event, StartActionsSubtaskEvent):
+                tools = ", ".join(f"{action['name']}.{action['path']}" for action in event.subtask_actions or [])
+                self._open_spans[event.task_id] = Span(
+                    tools or "actions", "tool", thread, event.timestamp, task_id=event.subtask_parent_task_id
+                )
+            elif isinstance(event, StartPromptEvent):
+                # Prompt events don't say which task they belong to, but they always run on the task's thread
+                self._open_spans[thread] = Span(event.model, "prompt", thread, event.timestamp)
+            elif isinstance(event, (FinishTaskEvent, FinishActionsSubtaskEvent)):
+                self.close_span(event.task_id, event.timestamp)
+            elif isinstance(event, FinishPromptEvent):
+                self.close_span(thread, event.timestamp)
+
+    def close_span(self, key: Any, timestamp: float) -> None:
+        span = self._open_spans.pop(key, None)
+        if span is not None:
+            span.end = timestamp
+            self.spans.append(span)
+
+    @property
+    def task_spans(self) -> list[Span]:
+        return sorted((span for span in self.spans if span.category == "task"), key=lambda span: span.start)
+
+    def ready_times(self) -> dict[str, float]:
+        """Returns the time each task was ready to run, which is when its last parent finished."""
+        task_spans = self.task_spans
+        end_times = {span.task_id: span.end or span.start for span in task_spans}
+
+        return {
+            str(span.task_id): max(
+                (end_times[parent_id] for parent_id in span.parent_ids if parent_id in end_times),
+                default=self.started_at,
+            )
+            for span in task_spans
+        }
+
+    def queue_waits(self) -> dict[str, float]:
+        ready_times = self.ready_times()
+
+        return {str(span.task_id): max(0.0, span.start - ready_times[str(span.task_id)]) for span in self.task_spans}
+
+    def summary(self) -> dict[str, float]:
+        task_spans = self.task_spans
+        makespan = self.finished_at - self.started_at
+        busy_time = sum(span.duration for span in task_spans)
+
+        return {
+            "makespan": makespan,
+            "busy_time": busy_time,
+            "average_parallelism": busy_time / makespan if makespan else 0.0,
+            "total_queue_wait": sum(self.queue_waits().values()),
+        }
+
+    def to_chrome_trace(self) -> dict:
+        """Converts the timeline to the Chrome trace event format.
+
+        Open the file at chrome://tracing or https://ui.perfetto.dev to explore it.
+        """
+        threads = sorted({span.thread for span in self.spans})
+        thread_ids = {thread: index + 1 for index, thread in enumerate(threads)}
+
+        def micros(timestamp: float) -> int:
+            return int((timestamp - self.started_at) * 1_000_000)
+
+        events: list[dict] = [
+            {"ph": "M", "pid": 1, "tid": tid, "name": "thread_name", "args": {"name": thread}}
+            for thread, tid in thread_ids.items()
+        ]
+        events.append({"ph": "M", "pid": 2, "tid": 0, "name": "process_name", "args": {"name": "Queue wait"}})
+
+        for span in self.spans:
+            events.append(
+                {
+                    "name": span.name,
+                    "cat": span.category,
+                    "ph": "X",
+                    "ts": micros(span.start),
+                    "dur": micros(span.end or span.start) - micros(span.start),
+                    "pid": 1,
+                    "tid": thread_ids[span.thread],
+                    "args": {"task_id": span.task_id},
+                }
+            )
+
+        ready_times = self.ready_times()
+        for index, span in enumerate(self.task_spans):
+            ready_at = ready_times[str(span.task_id)]
+            if span.start > ready_at:
+                events.append(
+                    {
+                        "name": f"waiting: {span.name}",
+                        "cat": "queue",
+                        "ph": "X",
+                        "ts": micros(ready_at),
+                        "dur": micros(span.start) - micros(ready_at),
+                        "pid": 2,
+                        "tid": index,
+                    }
+                )
+
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def save_chrome_trace(self, path: str) -> None:
+        with open(path, "w") as file:
+            json.dump(self.to_chrome_trace(), file)
+
+    def to_html(self) -> str:
+        """Renders the timeline as a self-contained HTML Gantt chart, one row per task."""
+        makespan = max(self.finished_at - self.started_at, 1e-9)
+
+        def percent(timestamp: float) -> float:
+            return 100 * (timestamp - self.started_at) / makespan
+
+        def bar(css_class: str, start: float, end: float, title: str) -> str:
+            left = percent(start)
+            width = max(percent(end) - left, 0.2)
+
+            return (
+                f'<div class="{css_class}" style="left:{left:.3f}%;width:{width:.3f}%" '
+                f'title="{html.escape(title)}"></div>'
+            )
+
+        # Group the tool and prompt activity by the task it happened in
+        task_spans = self.task_spans
+        activities: dict[str, list[Span]] = {str(span.task_id): [] for span in task_spans}
+        for activity in self.spans:
+            if activity.category != "task":
+                task_span = self.find_task_span(activity, task_spans)
+                if task_span is not None:
+                    activities[str(task_span.task_id)].append(activity)
+
+        ready_times = self.ready_times()
+        rows = []
+        for span in task_spans:
+            ready_at = ready_times[str(span.task_id)]
+            bars = [
+                bar("wait", ready_at, span.start, f"waiting {max(0.0, span.start - ready_at):.2f}s"),
+                bar("task", span.start, span.end or span.start, f"{span.name} {span.duration:.2f}s on {span.thread}"),
+            ]
+            bars += [
+                bar(activity.category, activity.start, activity.end or activity.start, activity.name)
+                for activity in activities[str(span.task_id)]
+            ]
+            rows.append(f'<div class="row"><div class="label">{html.escape(span.name)}</div>{"".join(bars)}</div>')
+
+        summary = self.summary()
+        stats = (
+            f"Makespan {summary['makespan']:.2f}s &middot; busy {summary['busy_time']:.2f}s &middot; "
+            f"average parallelism {summary['average_parallelism']:.2f} &middot; "
+            f"total queue wait {summary['total_queue_wait']:.2f}s"
+        )
+
+        return f"""<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>Workflow timeline</title>
+<style>
+  body {{ font-family: sans-serif; background: #2b2b2b; color: #ddd; }}
+  .row {{ position: relative; height: 22px; margin-left: 220px; border-bottom: 1px solid #3a3a3a; }}
+  .label {{ position: absolute; left: -220px; width: 210px; overflow: hidden; white-space: nowrap; font-size: 12px; }}
+  .row div[title] {{ position: absolute; top: 3px; height: 16px; }}
+  .wait {{ background: repeating-linear-gradient(45deg, #555, #555 4px, #444 4px, #444 8px); }}
+  .task {{ background: #426eff; }}
+  .row div.prompt {{ background: #f0a030; top: 9px; height: 6px; }}
+  .row div.tool {{ background: #f06090; top: 9px; height: 6px; }}
+</style>
+</head>
+<body>
+<h2>Workflow timeline</h2>
+<p>{stats}</p>
+<p>Striped: waiting for a worker &middot; blue: running &middot; orange: LLM call &middot; pink: tool activity</p>
+{"".join(rows)}
+</body>
+</html>
+"""
+
+    def find_task_span(self, activity: Span, task_spans: list[Span]) -> Optional[Span]:
+        for task_span in task_spans:
+            if activity.task_id is not None:
+                if activity.task_id == task_span.task_id:
+                    return task_span
+            # Prompt spans are matched to the task running on the same thread at the same time
+            elif activity.thread == task_span.thread and task_span.start <= activity.start <= (task_span.end or 0):
+                return task_span
+
+        return None
+
+    def save_html(self, path: str) -> None:
+        with open(path, "w") as file:
+            file.write(self.to_html())
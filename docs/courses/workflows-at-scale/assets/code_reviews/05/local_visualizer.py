@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import html
+from graphlib import TopologicalSorter
+from typing import TYPE_CHECKING, Callable
+
+from attrs import define, field
+
+if TYPE_CHECKING:
+    from griptape.structures import Structure
+    from griptape.tasks import BaseTask
+
+
+@define
+class Node:
+    """A box in the rendered graph, standing in for one or more tasks.
+
+    Attributes:
+        key: A unique key for the node.
+        label: The text shown in the box.
+        task_ids: The ids of the tasks this node stands in for.
+        parent_keys: The keys of the nodes this node depends on.
+    """
+
+    key: str = field()
+    label: str = field()
+    task_ids: list[str] = field(factory=list)
+    parent_keys: set[str] = field(factory=set)
+
+
+@define
+class LocalStructureVisualizer:
+    """Renders a Structure as a self-contained SVG or HTML file, without any external services.
+
+    Sibling tasks that share a group name, a task type and the same parents are collapsed into
+    a single node, so a fan-out of a thousand movies is drawn as one box instead of a thousand.
+
+    Attributes:
+        structure: The Structure to render.
+        build_group_name: Returns the group name of a task. Defaults to the part of the id before the first ':'.
+        collapse_threshold: The minimum number of tasks needed to collapse them into a single node.
+    """
+
+    structure: Structure = field()
+    build_group_name: Callable[[BaseTask], str] = field(default=lambda task: task.id.split(":")[0], kw_only=True)
+    collapse_threshold: int = field(default=3, kw_only=True)
+    node_width: int = field(default=180, kw_only=True)
+    node_height: int = field(default=40, kw_only=True)
+    horizontal_gap: int = field(default=30, kw_only=True)
+    vertical_gap: int = field(default=60, kw_only=True)
+    margin: int = field(default=10, kw_only=True)
+
+    def build_nodes(self) -> list[Node]:
+        """Collapses the tasks into nodes, returning them in topological order."""
+        self.structure.resolve_relationships()
+        tasks = {task.id: task for task in self.structure.tasks}
+        ordered_ids = TopologicalSorter({task.id: set(task.parent_ids) for task in tasks.values()}).static_order()
+
+        # Tasks are visited parents first, so each parent already knows which node it ended up in
+        node_key_by_task_id: dict[str, str] = {}
+        groups: dict[tuple, list[str]] = {}
+        for task_id in ordered_ids:
+            task = tasks[task_id]
+            parent_keys = tuple(sorted({node_key_by_task_id[parent_id] for parent_id in task.parent_ids}))
+            group_key = (self.build_group_name(task), task.__class__.__name__, parent_keys)
+            groups.setdefault(group_key, []).append(task_id)
+            node_key_by_task_id[task_id] = repr(group_key)
+
+        nodes = []
+        for (group_name, task_type, parent_keys), task_ids in groups.items():
+            if len(task_ids) >= self.collapse_threshold:
+                label = f"{task_type}: {group_name} ×{len(task_ids)}"
+                nodes.append(Node(repr((group_name, task_type, parent_keys)), label, task_ids, set(parent_keys)))
+            else:
+                # Too few to bother collapsing, so give each task a node of its own
+                for task_id in task_ids:
+                    node_key_by_task_id[task_id] = task_id
+                    nodes.append(Node(task_id, f"{task_type}: {task_id}", [task_id]))
+
+        # Now that we know the final node of every task, connect the nodes
+        for node in nodes:
+            node.parent_keys = {
+                node_key_by_task_id[parent_id] for task_id in node.task_ids for parent_id in tasks[task_id].parent_ids
+            }
+
+        return nodes
+
+    def layout(self, nodes: list[Node]) -> dict[str, tuple[int, int]]:
+        """Places each node in a layer below its deepest parent, returning the (x, y) of every node."""
+        layer_of: dict[str, int] = {}
+        layers: list[list[Node]] = []
+        for node in nodes:
+            layer = max((layer_of[parent_key] + 1 for parent_key in node.parent_keys), default=0)
+            layer_of[node.key] = layer
+            if layer == len(layers):
+                layers.append([])
+            layers[layer].append(node)
+
+        positions: dict[str, tuple[int, int]] = {}
+        for layer, layer_nodes in enumerate(layers):
+            # Order each layer by the average position of its parents to keep edges from crossing
+            def barycenter(node: Node) -> float:
+                xs = [positions[parent_key][0] for parent_key in node.parent_keys]
+
+                return sum(xs) / len(xs) if xs else 0.0
+
+            layer_nodes.sort(key=barycenter)
+            for index, node in enumerate(layer_nodes):
+                positions[node.key] = (
+                    self.margin + index * (self.node_width + self.horizontal_gap),
+                    self.margin + layer * (self.node_height + self.vertical_gap),
+                )
+
+        return positions
+
+    def to_svg(self) -> str:
+        nodes = self.build_nodes()
+        positions = self.layout(nodes)
+        width = max(x for x, _ in positions.values()) + self.node_width + self.margin
+        height = max(y for _, y in positions.values()) + self.node_height + self.margin
+
+        edges = []
+        for node in nodes:
+            child_x, child_y = positions[node.key]
+            for parent_key in node.parent_keys:
+                parent_x, parent_y = positions[parent_key]
+                start = (parent_x + self.node_width / 2, parent_y + self.node_height)
+                end = (child_x + self.node_width / 2, child_y)
+                middle = (start[1] + end[1]) / 2
+                edges.append(
+                    f'<path d="M{start[0]},{start[1]} C{start[0]},{middle} {end[0]},{middle} {end[0]},{end[1]}" '
+                    'fill="none" stroke="#888" marker-end="url(#arrow)"/>'
+                )
+
+        boxes = []
+        for node in nodes:
+            x, y = positions[node.key]
+            stroke = "#f06090" if len(node.task_ids) > 1 else "#426eff"
+            title = html.escape("\n".join(node.task_ids[:20] + (["..."] if len(node.task_ids) > 20 else [])))
+            boxes.append(
+                f"<g><title>{title}</title>"
+                f'<rect x="{x}" y="{y}" width="{self.node_width}" height="{self.node_height}" rx="6" '
+                f'fill="#4274ff1a" stroke="{stroke}"/>'
+                f'<text x="{x + self.node_width / 2}" y="{y + self.node_height / 2}" fill="#ddd" '
+                f'font-family="sans-serif" font-size="12" text-anchor="middle" dominant-baseline="middle">'
+                f"{html.escape(self.truncate(node.label))}</text></g>"
+            )
+
+        return (
+            f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+            f'viewBox="0 0 {width} {height}">'
+            '<defs><marker id="arrow" viewBox="0 0 10 10" refX="10" refY="5" markerWidth="6" markerHeight="6" '
+            'orient="auto-start-reverse"><path d="M 0 0 L 10 5 L 0 10 z" fill="#888"/></marker></defs>'
+            f"{''.join(edges)}{''.join(boxes)}</svg>"
+        )
+
+    def to_html(self) -> str:
+        return (
+            '<!DOCTYPE html>\n<html>\n<head><meta charset="utf-8"><title>Structure</title></head>\n'
+            f'<body style="background:#2b2b2b">\n{self.to_svg()}\n</body>\n</html>\n'
+        )
+
+    def save(self, path: str) -> str:
+        """Writes the graph to `path`, as SVG if the path ends in .svg and HTML otherwise."""
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(self.to_svg() if path.endswith(".svg") else self.to_html())
+
+        return path
+
+    def truncate(self, label: str) -> str:
+        # Roughly 7 pixels per character at this font size
+        max_characters = self.node_width // 7
+        return label if len(label) <= max_characters else label[: max_characters - 1] + "…"
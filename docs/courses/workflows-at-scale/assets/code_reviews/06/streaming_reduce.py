@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import concurrent.futures as futures
+from typing import Optional
+
+from attrs import define, field
+
+# Griptape
+from griptape.artifacts import BaseArtifact, ErrorArtifact
+from griptape.common import PromptStack, observable
+from griptape.structures import Workflow
+from griptape.tasks import BaseTask, PromptTask
+from griptape.utils import J2, with_contextvars
+
+
+@define
+class ReducePromptTask(PromptTask):
+    """A PromptTask that merges its parent outputs a group at a time, as the parents finish.
+
+    In a `StreamingReduceWorkflow`, every time `group_size` parent outputs are waiting, they are
+    merged into one with `merge_prompt`. Merged outputs go back into the pool and are merged again,
+    so the task only ever sees at most `group_size` outputs at once. In a regular Workflow it
+    behaves just like a PromptTask.
+
+    Attributes:
+        group_size: The maximum number of outputs rendered into a single prompt.
+        merge_prompt: The template used to merge a group of outputs. Defaults to the task's own input.
+    """
+
+    group_size: int = field(default=10, kw_only=True)
+    merge_prompt: Optional[str] = field(default=None, kw_only=True)
+    pending_outputs: dict[str, BaseArtifact] = field(factory=dict, init=False)
+    absorbed_parent_ids: set[str] = field(factory=set, init=False)
+    merges_in_progress: int = field(default=0, init=False)
+    merge_count: int = field(default=0, init=False)
+
+    @group_size.validator  # pyright: ignore[reportAttributeAccessIssue]
+    def validate_group_size(self, _, group_size: int) -> None:
+        # Merging fewer than two outputs would never make the pool any smaller
+        if group_size < 2:
+            raise ValueError("group_size must be at least 2.")
+
+    @property
+    def parent_outputs(self) -> dict[str, BaseArtifact]:
+        # Once we've started merging, the pending outputs stand in for the parent outputs
+        if self.absorbed_parent_ids:
+            return dict(self.pending_outputs)
+
+        return super().parent_outputs
+
+    @property
+    def parents_output_text(self) -> str:
+        return "\n".join(output.to_text() for output in self.parent_outputs.values())
+
+    def all_parents_finished(self) -> bool:
+        return all(parent.is_finished() for parent in self.parents)
+
+    def can_run(self) -> bool:
+        return super().can_run() and self.merges_in_progress == 0 and len(self.pending_outputs) <= self.group_size
+
+    def reset(self) -> ReducePromptTask:
+        super().reset()
+        self.pending_outputs.clear()
+        self.absorbed_parent_ids.clear()
+        self.merges_in_progress = 0
+        self.merge_count = 0
+
+        return self
+
+    def take_ready_groups(self) -> list[dict[str, BaseArtifact]]:
+        """Collects any newly finished parent outputs and returns the groups that are ready to merge."""
+        for parent in self.parents:
+            if parent.is_finished() and parent.id not in self.absorbed_parent_ids and parent.output is not None:
+                self.pending_outputs[parent.id] = parent.output
+                self.absorbed_parent_ids.add(parent.id)
+
+        all_parents_finished = self.all_parents_finished()
+        groups = []
+        # Merge whenever a full group is waiting. Once every parent has finished, the last group
+        # is left for the task itself to run on.
+        while len(self.pending_outputs) > self.group_size or (
+            len(self.pending_outputs) == self.group_size and not all_parents_finished
+        ):
+            keys = list(self.pending_outputs)[: self.group_size]
+            groups.append({key: self.pending_outputs.pop(key) for key in keys})
+
+        self.merges_in_progress += len(groups)
+
+        return groups
+
+    def add_merged_output(self, output: BaseArtifact) -> None:
+        self.merge_count += 1
+        self.pending_outputs[f"{self.id}:merge:{self.merge_count}"] = output
+        self.merges_in_progress -= 1
+
+    def merge(self, group: dict[str, BaseArtifact]) -> BaseArtifact:
+        template = self.merge_prompt if self.merge_prompt is not None else self._input
+        if not isinstance(template, str):
+            raise ValueError("ReducePromptTask needs a string template to merge outputs.")
+
+        context = {
+            "args": self.structure.execution_args if self.structure is not None else (),
+            "structure": self.structure,
+            **self.context,
+            "parent_outputs": group,
+            "parents_output_text": "\n".join(output.to_text() for output in group.values()),
+        }
+
+        stack = PromptStack()
+        system_template = self.generate_system_template(self)
+        if system_template:
+            stack.add_system_message(system_template)
+        stack.add_user_message(J2().render_from_string(template, **context))
+
+        try:
+            return self.prompt_driver.run(stack).to_artifact()
+        except Exception as e:
+            return ErrorArtifact(str(e), exception=e)
+
+
+@define
+class StreamingReduceWorkflow(Workflow):
+    """A Workflow that starts tasks as soon as they're ready and merges `ReducePromptTask` inputs as they arrive."""
+
+    @observable
+    def try_run(self, *args) -> Workflow:
+        running_tasks: dict[futures.Future, BaseTask] = {}
+        running_merges: dict[futures.Future, ReducePromptTask] = {}
+        started_ids: set[str] = set()
+
+        while True:
+            for task in self.tasks:
+                # Merge any groups of parent outputs that are ready, without waiting for the rest
+                if isinstance(task, ReducePromptTask) and task.is_pending():
+                    for group in task.take_ready_groups():
+                        running_merges[self.futures_executor.submit(with_contextvars(task.merge), group)] = task
+
+                if task.id not in started_ids and task.can_run():
+                    started_ids.add(task.id)
+                    running_tasks[self.futures_executor.submit(with_contextvars(task.run))] = task
+
+            if not running_tasks and not running_merges:
+                break
+
+            # Wait for the first task or merge to finish rather than the whole batch
+            done, _ = futures.wait([*running_tasks, *running_merges], return_when=futures.FIRST_COMPLETED)
+            for future in done:
+                if future in running_merges:
+                    running_merges.pop(future).add_merged_output(future.result())
+                else:
+                    running_tasks.pop(future)
+
+                if isinstance(future.result(), ErrorArtifact) and self.fail_fast:
+                    futures.wait([*running_tasks, *running_merges])
+
+                    return self
+
+        return self
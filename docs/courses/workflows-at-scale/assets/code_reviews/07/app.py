@@ -0,0 +1,16 @@
+from pathlib import Path
+
+from dotenv import load_dotenv
+
+from workflow_spec import load_workflow
+
+load_dotenv()
+
+# Load the workflow from the spec file next to this script
+workflow = load_workflow(str(Path(__file__).parent / "movies.yml"))
+
+# Run the workflow
+workflow.run()
+
+# View the output
+print(workflow.output.value)
@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from graphlib import CycleError, TopologicalSorter
+from typing import Any, Optional
+
+import yaml
+from attrs import define, field
+
+# Griptape
+from griptape import tasks as griptape_tasks
+from griptape import tools as griptape_tools
+from griptape.structures import Workflow
+from griptape.tasks import BaseTask
+
+
+class WorkflowSpecError(ValueError):
+    """Raised when a workflow spec is invalid."""
+
+
+@define
+class CompiledWorkflow(Workflow):
+    """A Workflow that looks tasks up by id in a dictionary instead of searching the task list.
+
+    Griptape's Workflow finds a task by looping over every task, which makes adding tasks,
+    finding parents and ordering the graph slow down as the Workflow grows. With an index,
+    building a Workflow of V tasks and E edges with add_task, and running it, takes O(V + E).
+    insert_task still costs O(V) per call, because it inserts into the middle of the task list.
+    """
+
+    _task_index: dict[str, BaseTask] = field(factory=dict, init=False)
+
+    def add_task(self, task: BaseTask) -> BaseTask:
+        if (existing_task := self._task_index.get(task.id)) is not None:
+            return existing_task
+
+        task.preprocess(self)
+
+        self._tasks.append(task)
+        self._task_index[task.id] = task
+
+        return task
+
+    def insert_task(
+        self,
+        parent_tasks: list[BaseTask],
+        task: BaseTask,
+        child_tasks: list[BaseTask],
+        *,
+        preserve_relationship: bool = False,
+    ) -> BaseTask:
+        # Workflow.insert_task adds to the task list directly, so index the task here too.
+        # It still searches the task list for the parents and inserts into the middle of it, so this stays O(V).
+        super().insert_task(parent_tasks, task, child_tasks, preserve_relationship=preserve_relationship)
+        self._task_index[task.id] = task
+
+        return task
+
+    def try_find_task(self, task_id: str) -> Optional[BaseTask]:
+        return self._task_index.get(task_id)
+
+    def to_graph(self) -> dict[str, set[str]]:
+        return {task.id: set(task.parent_ids) for task in self.tasks}
+
+    def resolve_relationships(self) -> None:
+        # The same checks as Structure.resolve_relationships, but using sets so that
+        # a task with thousands of children doesn't rescan its child list for every one
+        task_by_id = {}
+        for task in self.tasks:
+            if task.id in task_by_id:
+                raise ValueError(f"Duplicate task with id {task.id} found.")
+            task_by_id[task.id] = task
+
+        parent_id_sets = {task.id: set(task.parent_ids) for task in task_by_id.values()}
+        child_id_sets = {task.id: set(task.child_ids) for task in task_by_id.values()}
+
+        for task in task_by_id.values():
+            for parent_id in task.parent_ids:
+                if parent_id not in task_by_id:
+                    raise ValueError(f"Task with id {parent_id} doesn't exist.")
+                if task.id not in child_id_sets[parent_id]:
+                    task_by_id[parent_id].child_ids.append(task.id)
+                    child_id_sets[parent_id].add(task.id)
+
+            for child_id in task.child_ids:
+                if child_id not in task_by_id:
+                    raise ValueError(f"Task with id {child_id} doesn't exist.")
+                if task.id not in parent_id_sets[child_id]:
+                    task_by_id[child_id].parent_ids.append(task.id)
+                    parent_id_sets[child_id].add(task.id)
+
+
+def load_spec(path: str) -> dict:
+    with open(path) as file:
+        if path.endswith((".yml", ".yaml")):
+            return yaml.safe_load(file)
+        return json.load(file)
+
+
+def spec_hash(spec: dict) -> str:
+    return hashlib.sha256(json.dumps(spec, sort_keys=True).encode()).hexdigest()
+
+
+def expand_tasks(spec: dict) -> list[dict]:
+    """Expands every `for_each` task into one task per item."""
+    context = spec.get("context", {})
+    templates = spec.get("templates", {})
+    expanded = []
+
+    for task_spec in spec.get("tasks", []):
+        if "template" in task_spec and task_spec["template"] not in templates:
+            raise WorkflowSpecError(f"Task {task_spec.get('id')} uses unknown template {task_spec['template']}.")
+        prompt = templates.get(task_spec.get("template"), task_spec.get("prompt", ""))
+
+        if "for_each" in task_spec:
+            items = context.get(task_spec["for_each"])
+            if not isinstance(items, list):
+                raise WorkflowSpecError(
+                    f"Task {task_spec['id']} loops over {task_spec['for_each']}, which isn't a list."
+                )
+        else:
+            items = [None]
+
+        for index, item in enumerate(items):
+            task_context = dict(task_spec.get("context", {}))
+            if item is not None:
+                task_context[task_spec.get("as", "item")] = item
+
+            expanded.append(
+                {
+                    "id": task_spec["id"].format(index=index),
+                    "type": task_spec.get("type", "PromptTask"),
+                    "prompt": prompt,
+                    "context": task_context,
+                    "tools": task_spec.get("tools", []),
+                    "parents": [parent.format(index=index) for parent in task_spec.get("parents", [])],
+                }
+            )
+
+    return expanded
+
+
+def compile_spec(spec: dict) -> list[dict]:
+    """Validates a spec and returns its tasks in topological order with their parents resolved."""
+    task_specs = expand_tasks(spec)
+
+    task_ids = set()
+    for task_spec in task_specs:
+        if task_spec["id"] in task_ids:
+            raise WorkflowSpecError(f"Duplicate task with id {task_spec['id']} found.")
+        task_ids.add(task_spec["id"])
+
+    # Resolve "PREFIX*" parents with one pass over the ids for each distinct prefix
+    prefixes = {parent[:-1] for task_spec in task_specs for parent in task_spec["parents"] if parent.endswith("*")}
+    ids_by_prefix: dict[str, list[str]] = {prefix: [] for prefix in prefixes}
+    for task_spec in task_specs:
+        for prefix in prefixes:
+            if task_spec["id"].startswith(prefix):
+                ids_by_prefix[prefix].append(task_spec["id"])
+
+    for task_spec in task_specs:
+        parent_ids = []
+        for parent in task_spec.pop("parents"):
+            if parent.endswith("*"):
+                parent_ids.extend(ids_by_prefix[parent[:-1]])
+            elif parent in task_ids:
+                parent_ids.append(parent)
+            else:
+                raise WorkflowSpecError(f"Task {task_spec['id']} has a parent {parent} that doesn't exist.")
+        task_spec["parent_ids"] = parent_ids
+
+    task_specs_by_id = {task_spec["id"]: task_spec for task_spec in task_specs}
+    try:
+        order = TopologicalSorter({task_id: task_spec["parent_ids"] for task_id, task_spec in task_specs_by_id.items()})
+        ordered_ids = list(order.static_order())
+    except CycleError as e:
+        raise WorkflowSpecError(f"The workflow has a cycle: {' -> '.join(e.args[1])}") from e
+
+    return [task_specs_by_id[task_id] for task_id in ordered_ids]
+
+
+def compile_spec_cached(spec: dict, cache_dir: str = ".workflow_cache") -> list[dict]:
+    """Compiles a spec, reusing the compiled form from a previous run if the spec hasn't changed."""
+    cache_path = os.path.join(cache_dir, f"{spec_hash(spec)}.json")
+
+    if os.path.exists(cache_path):
+        with open(cache_path) as file:
+            return json.load(file)
+
+    compiled = compile_spec(spec)
+
+    os.makedirs(cache_dir, exist_ok=True)
+    with open(cache_path, "w") as file:
+        json.dump(compiled, file)
+
+    return compiled
+
+
+def build_tool(tool_spec: str | dict) -> Any:
+    if isinstance(tool_spec, str):
+        tool_spec = {"name": tool_spec}
+    options = {key: value for key, value in tool_spec.items() if key != "name"}
+
+    return getattr(griptape_tools, tool_spec["name"])(**options)
+
+
+def build_workflow(compiled: list[dict], **kwargs) -> CompiledWorkflow:
+    """Creates a CompiledWorkflow from a compiled spec."""
+    workflow_tasks = []
+    for task_spec in compiled:
+        task_class = getattr(griptape_tasks, task_spec["type"])
+        options: dict[str, Any] = {
+            "id": task_spec["id"],
+            "context": task_spec["context"],
+            "parent_ids": list(task_spec["parent_ids"]),
+        }
+        if task_spec["tools"]:
+            options["tools"] = [build_tool(tool_spec) for tool_spec in task_spec["tools"]]
+
+        workflow_tasks.append(task_class(task_spec["prompt"], **options))
+
+    workflow = CompiledWorkflow(tasks=workflow_tasks, **kwargs)
+    workflow.resolve_relationships()
+
+    return workflow
+
+
+def load_workflow(path: str, cache_dir: str = ".workflow_cache", **kwargs) -> CompiledWorkflow:
+    """Loads, compiles and builds the Workflow described by the spec at `path`."""
+    return build_workflow(compile_spec_cached(load_spec(path), cache_dir), **kwargs)
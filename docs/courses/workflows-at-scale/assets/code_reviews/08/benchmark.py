@@ -0,0 +1,51 @@
+import sys
+import time
+
+# Griptape
+from griptape.tasks import PromptTask
+
+from template_cache import cached_templates
+
+# Pass the number of tasks on the command line, for example: python benchmark.py 10000
+task_count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+
+# A long template, like the SEO one from the Image Query course
+template = """
+Based on this image description, create the following:
+A nice title based on the image name,
+The path to the image: {{ image_path }},
+Brief SEO description, alt-text, 3 keywords, caption,
+and an HTML snippet to display the image.
+{% for key, value in notes.items() %}
+{{ key }}: {{ value }}
+{% endfor %}
+"""
+
+tasks = [
+    PromptTask(
+        template,
+        context={"image_path": f"images/image_{index}.png", "notes": {"index": index}},
+        id=f"SEO:{index}",
+    )
+    for index in range(task_count)
+]
+
+
+def render_all() -> float:
+    start_time = time.perf_counter()
+    for task in tasks:
+        # This is what every PromptTask renders before it sends its prompt
+        task.input.to_text()
+        task.generate_system_template(task)
+
+    return time.perf_counter() - start_time
+
+
+before = render_all()
+with cached_templates():
+    after = render_all()
+
+print(f"Rendered {task_count} tasks")
+print(f"Without the cache: {before:.2f}s ({1000 * before / task_count:.3f}ms per task)")
+print(f"With the cache:    {after:.2f}s ({1000 * after / task_count:.3f}ms per task)")
+print(f"Speedup:           {before / after:.1f}x")
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import contextlib
+import threading
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+from jinja2 import Environment, FileSystemLoader
+
+# Griptape
+from griptape.utils import J2
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from jinja2 import Template
+
+# The original methods, so the cache can be turned off again
+_original_render = J2.render
+_original_render_from_string = J2.render_from_string
+_lock = threading.Lock()
+_depth = 0
+
+
+@lru_cache(maxsize=None)
+def get_environment(templates_dir: str) -> Environment:
+    """Returns one shared Environment per templates directory, with the same options J2 uses.
+
+    Jinja already caches templates loaded from files, but only inside a single Environment.
+    J2 creates a new Environment every time it's used, so that cache is thrown away.
+    """
+    return Environment(loader=FileSystemLoader(templates_dir), trim_blocks=True, lstrip_blocks=True)
+
+
+@lru_cache(maxsize=4096)
+def compile_template(templates_dir: str, text: str) -> Template:
+    """Parses and compiles a template string once, returning the same Template for the same text."""
+    return get_environment(templates_dir).from_string(text)
+
+
+def cached_render(self: J2, **kwargs) -> str:
+    if self.template_name is None:
+        raise ValueError("template_name is required.")
+    return get_environment(self.templates_dir).get_template(self.template_name).render(kwargs).rstrip()
+
+
+def cached_render_from_string(self: J2, value: str, **kwargs) -> str:
+    return compile_template(self.templates_dir, value).render(kwargs)
+
+
+def enable_template_cache() -> None:
+    """Makes every J2 template in Griptape render from a shared cache of compiled templates."""
+    J2.render = cached_render
+    J2.render_from_string = cached_render_from_string
+
+
+def disable_template_cache() -> None:
+    J2.render = _original_render
+    J2.render_from_string = _original_render_from_string
+
+
+@contextlib.contextmanager
+def cached_templates() -> Iterator[None]:
+    """Turns the template cache on for the duration of a `with` block."""
+    global _depth
+
+    with _lock:
+        if _depth == 0:
+            enable_template_cache()
+        _depth += 1
+    try:
+        yield
+    finally:
+        with _lock:
+            _depth -= 1
+            if _depth == 0:
+                disable_template_cache()
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import re
+from typing import TYPE_CHECKING, Optional
+
+from attrs import Factory, define, field
+
+# Griptape
+from griptape.artifacts import TextArtifact
+from griptape.chunkers import TextChunker
+from griptape.engines import PromptSummaryEngine
+from griptape.tasks import PromptTask
+
+if TYPE_CHECKING:
+    from griptape.artifacts import BaseArtifact
+    from griptape.tokenizers import BaseTokenizer
+
+STRATEGIES = ("truncate", "select", "summarize")
+WORD_PATTERN = re.compile(r"\w{3,}")
+
+
+def allocate_budget(token_counts: dict[str, int], budget: int) -> dict[str, int]:
+    """Splits a token budget between outputs, so that short outputs are kept whole.
+
+    Outputs that fit in an even share keep all of their tokens, and whatever they
+    don't use is shared out between the longer ones.
+    """
+    shares = {}
+    remaining_budget = budget
+    remaining_ids = sorted(token_counts, key=lambda output_id: token_counts[output_id])
+
+    while remaining_ids:
+        share = remaining_budget // len(remaining_ids)
+        output_id = remaining_ids.pop(0)
+        shares[output_id] = min(token_counts[output_id], share)
+        remaining_budget -= shares[output_id]
+
+    return shares
+
+
+@define
+class BudgetedPromptTask(PromptTask):
+    """A PromptTask that fits its parent outputs into a token budget before they reach the prompt.
+
+    Attributes:
+        max_parent_tokens: The most tokens that all the parent outputs may use together.
+        strategy: How to shrink outputs that don't fit: "truncate", "select" or "summarize".
+        query: Words describing what matters, used by the "select" strategy to rank chunks.
+        chunk_tokens: The size of the chunks the "select" strategy chooses between.
+        tokenizer: The tokenizer used to count tokens. Defaults to the prompt driver's tokenizer.
+        summary_engine: The engine used by the "summarize" strategy.
+        truncation_marker: Text added where an output was cut short.
+    """
+
+    max_parent_tokens: int = field(kw_only=True)
+    strategy: str = field(default="truncate", kw_only=True)
+    query: Optional[str] = field(default=None, kw_only=True)
+    chunk_tokens: int = field(default=100, kw_only=True)
+    tokenizer: BaseTokenizer = field(
+        default=Factory(lambda self: self.prompt_driver.tokenizer, takes_self=True), kw_only=True
+    )
+    summary_engine: PromptSummaryEngine = field(
+        default=Factory(lambda self: PromptSummaryEngine(prompt_driver=self.prompt_driver), takes_self=True),
+        kw_only=True,
+    )
+    truncation_marker: str = field(default=" [...]", kw_only=True)
+    fitted_outputs: dict[str, BaseArtifact] = field(factory=dict, init=False)
+    fitted_key: Optional[tuple] = field(default=None, init=False)
+
+    @strategy.validator  # pyright: ignore[reportAttributeAccessIssue]
+    def validate_strategy(self, _, strategy: str) -> None:
+        if strategy not in STRATEGIES:
+            raise ValueError(f"strategy must be one of {', '.join(STRATEGIES)}.")
+
+    @property
+    def parent_outputs(self) -> dict[str, BaseArtifact]:
+        outputs = super().parent_outputs
+        key = tuple((parent_id, id(output)) for parent_id, output in outputs.items())
+
+        # Summarizing costs prompts, so only fit the outputs again if they've changed
+        if key != self.fitted_key:
+            self.fitted_outputs = self.fit_outputs(outputs)
+            self.fitted_key = key
+
+        return self.fitted_outputs
+
+    @property
+    def parents_output_text(self) -> str:
+        return "\n".join(output.to_text() for output in self.parent_outputs.values())
+
+    def reset(self) -> BudgetedPromptTask:
+        super().reset()
+        self.fitted_outputs = {}
+        self.fitted_key = None
+
+        return self
+
+    def count_tokens(self, text: str) -> int:
+        return self.tokenizer.count_tokens(text)
+
+    def fit_outputs(self, outputs: dict[str, BaseArtifact]) -> dict[str, BaseArtifact]:
+        texts = {parent_id: output.to_text() for parent_id, output in outputs.items()}
+        token_counts = {parent_id: self.count_tokens(text) for parent_id, text in texts.items()}
+        shares = allocate_budget(token_counts, self.max_parent_tokens)
+        fitted = {}
+
+        for parent_id, output in outputs.items():
+            if token_counts[parent_id] <= shares[parent_id]:
+                fitted[parent_id] = output
+            else:
+                fitted[parent_id] = TextArtifact(self.shrink(texts[parent_id], shares[parent_id]))
+
+        return fitted
+
+    def shrink(self, text: str, max_tokens: int) -> str:
+        if self.strategy == "summarize":
+            text = self.summary_engine.summarize_text(text)
+        elif self.strategy == "select" and self.query:
+            text = self.select(text, max_tokens)
+
+        return self.truncate(text, max_tokens)
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        """Cuts the text at a word boundary so that it fits in max_tokens, counting the marker."""
+        if self.count_tokens(text) <= max_tokens:
+            return text
+
+        max_tokens -= self.count_tokens(self.truncation_marker)
+        if max_tokens <= 0:
+            return ""
+
+        # Find the longest prefix that fits, with a binary search over its length in characters
+        low, high = 0, len(text)
+        while low < high:
+            middle = (low + high + 1) // 2
+            if self.count_tokens(text[:middle]) <= max_tokens:
+                low = middle
+            else:
+                high = middle - 1
+
+        prefix = text[:low]
+        if " " in prefix:
+            prefix = prefix.rsplit(" ", 1)[0]
+
+        return prefix + self.truncation_marker
+
+    def select(self, text: str, max_tokens: int) -> str:
+        """Keeps the chunks of the text that share the most words with the query, in their original order."""
+        query_words = set(WORD_PATTERN.findall((self.query or "").lower()))
+        chunker = TextChunker(tokenizer=self.tokenizer, max_tokens=self.chunk_tokens)
+        chunks = [chunk.value for chunk in chunker.chunk(text)]
+
+        def score(index: int) -> int:
+            return sum(word in query_words for word in WORD_PATTERN.findall(chunks[index].lower()))
+
+        selected = []
+        used_tokens = 0
+        for index in sorted(range(len(chunks)), key=score, reverse=True):
+            chunk_tokens = self.count_tokens(chunks[index])
+            if used_tokens + chunk_tokens <= max_tokens:
+                selected.append(index)
+                used_tokens += chunk_tokens
+
+        return "\n...\n".join(chunks[index] for index in sorted(selected))
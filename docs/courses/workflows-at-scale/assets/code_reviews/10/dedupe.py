@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import concurrent.futures as futures
+import hashlib
+import re
+
+from attrs import define, field
+
+# Griptape
+from griptape.artifacts import BaseArtifact, ErrorArtifact
+from griptape.common import observable
+from griptape.structures import Workflow
+from griptape.tasks import BaseTask
+from griptape.utils import with_contextvars
+
+
+@define
+class DedupingWorkflow(Workflow):
+    """A Workflow that runs identical tasks only once.
+
+    Two tasks are identical when they are the same kind of task, use the same tools and
+    prompt driver model, and their rendered inputs match. The first one runs, and every
+    other one is given its output.
+
+    Attributes:
+        normalize_input: Ignore case and extra whitespace when comparing rendered inputs.
+        shared_outputs: The output of every task run so far, by task key.
+        deduped_task_ids: The ids of the tasks that were given another task's output during the last run.
+    """
+
+    normalize_input: bool = field(default=True, kw_only=True)
+    shared_outputs: dict[str, BaseArtifact] = field(factory=dict, init=False)
+    deduped_task_ids: list[str] = field(factory=list, init=False)
+
+    def task_key(self, task: BaseTask) -> str:
+        # The rendered input includes the parent outputs, so two near-duplicate movie
+        # descriptions that resolve to the same title will also share every task after it.
+        task_input = task.input.to_text()
+        if self.normalize_input:
+            task_input = re.sub(r"\s+", " ", task_input).strip().lower()
+
+        tools = sorted(f"{tool.__class__.__name__}:{tool.off_prompt}" for tool in getattr(task, "tools", []))
+        prompt_driver = getattr(task, "prompt_driver", None)
+        model = getattr(prompt_driver, "model", None)
+        task_key = f"{task.__class__.__name__}:{model}:{','.join(tools)}:{task_input}"
+
+        return hashlib.sha256(task_key.encode()).hexdigest()
+
+    def share_output(self, task: BaseTask, output: BaseArtifact) -> None:
+        task.output = output
+        task.state = BaseTask.State.FINISHED
+
+        self.deduped_task_ids.append(task.id)
+
+    @observable
+    def try_run(self, *args) -> Workflow:
+        self.shared_outputs.clear()
+        self.deduped_task_ids.clear()
+        exit_loop = False
+
+        while not self.is_finished() and not exit_loop:
+            futures_list = {}
+            duplicates = {}
+            ordered_tasks = self.order_tasks()
+
+            for task in ordered_tasks:
+                if task.can_run():
+                    key = self.task_key(task)
+
+                    # An identical task already finished, so reuse its output
+                    if key in self.shared_outputs:
+                        self.share_output(task, self.shared_outputs[key])
+                        continue
+
+                    # An identical task is running right now, so wait for it
+                    if key in duplicates:
+                        duplicates[key].append(task)
+                        continue
+
+                    future = self.futures_executor.submit(with_contextvars(task.run))
+                    futures_list[future] = (task, key)
+                    duplicates[key] = []
+
+            # Wait for all tasks to complete, then share each output with its duplicates
+            for future in futures.as_completed(futures_list):
+                task, key = futures_list[future]
+
+                if isinstance(future.result(), ErrorArtifact) and self.fail_fast:
+                    exit_loop = True
+
+                    break
+
+                if task.output is not None and not isinstance(task.output, ErrorArtifact):
+                    self.shared_outputs[key] = task.output
+
+                for duplicate in duplicates[key]:
+                    self.share_output(duplicate, future.result())
+
+        return self
@@ -0,0 +1,69 @@
+from dotenv import load_dotenv
+
+# Griptape
+from griptape.structures import Workflow
+from griptape.tasks import PromptTask, ToolkitTask
+from griptape.tools import PromptSummaryTool, WebScraperTool
+
+from map_task import MapTask
+
+load_dotenv()
+
+
+def read_movie_descriptions():
+    # This could just as easily read one line at a time from a huge file
+    yield "A boy discovers an alien in his back yard"
+    yield "A shark attacks a beach"
+    yield "A princess and a man named Wesley"
+
+
+def create_movie_tasks(description: str) -> list:
+    # Create the tasks for a single movie. They're created just before they run.
+    return [
+        PromptTask(
+            "What movie title is this? Return only the movie name: {{ description }}",
+            context={"description": description},
+            id="MOVIE",
+        ),
+        ToolkitTask(
+            "Use metacritic to get a summary of this movie: {{ parent_output }}",
+            tools=[WebScraperTool(), PromptSummaryTool(off_prompt=False)],
+            id="SUMMARY",
+        ),
+    ]
+
+
+# Create the workflow object
+workflow = Workflow()
+
+# Create tasks
+start_task = PromptTask("I will provide you a list of movies to compare.", id="START")
+map_task = MapTask(
+    items_factory=read_movie_descriptions,
+    task_factory=create_movie_tasks,
+    max_workers=2,
+    id="MOVIES",
+)
+end_task = PromptTask(
+    """
+    How are these movies the same:
+     {% for value in parent_outputs.values() %}
+     {{ value }}
+     {% endfor %}
+    """,
+    id="END",
+)
+
+# Add tasks to workflow
+workflow.add_task(start_task)
+workflow.add_task(end_task)
+workflow.insert_tasks(start_task, [map_task], end_task)
+
+# Run the workflow
+workflow.run()
+
+# View the output
+print(workflow.output.value)
+
+# See how many movies were in progress at once
+print(f"Mapped {map_task.item_count} movies, with at most {map_task.peak_in_flight} in progress at once.")
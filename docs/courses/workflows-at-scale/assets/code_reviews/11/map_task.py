@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import concurrent.futures as futures
+from typing import TYPE_CHECKING, Any, Callable
+
+from attrs import define, field
+
+# Griptape
+from griptape.artifacts import BaseArtifact, ErrorArtifact, ListArtifact
+from griptape.structures import Pipeline
+from griptape.tasks import BaseTask
+from griptape.utils import with_contextvars
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+
+@define
+class MapTask(BaseTask):
+    """A task that runs a small Pipeline of tasks for every item in an iterable.
+
+    Tasks are only created when there's a free worker to run them, and are thrown away
+    as soon as they finish, so memory grows with max_workers instead of with the number of items.
+
+    Attributes:
+        items_factory: Returns the inputs to map over. It's called on every run, so it can return a generator,
+            which is read one item at a time and would be used up after one run.
+        task_factory: Creates the tasks for one item. They run in order, as a Pipeline.
+        max_workers: The most items that are in progress at once.
+        peak_in_flight: The most items that were in progress at once during the last run.
+        item_count: The number of items mapped during the last run.
+    """
+
+    items_factory: Callable[[], Iterable[Any]] = field(kw_only=True)
+    task_factory: Callable[[Any], list[BaseTask]] = field(kw_only=True)
+    max_workers: int = field(default=4, kw_only=True)
+    peak_in_flight: int = field(default=0, init=False)
+    item_count: int = field(default=0, init=False)
+
+    @property
+    def input(self) -> BaseArtifact:
+        return ListArtifact(list(self.parent_outputs.values()))
+
+    def run_item(self, item: Any) -> BaseArtifact:
+        # A Pipeline of its own gives the tasks parents to render {{ parent_output }} from
+        pipeline = Pipeline(conversation_memory=None)
+        pipeline.add_tasks(*self.task_factory(item))
+        pipeline.run()
+
+        output_task = pipeline.output_task
+        if output_task is None or output_task.output is None:
+            return ErrorArtifact(f"No output for item {item!r}")
+        return output_task.output
+
+    def try_run(self) -> BaseArtifact:
+        outputs = {}
+        in_flight = {}
+        items = iter(self.items_factory())
+        self.peak_in_flight = 0
+        self.item_count = 0
+
+        with futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while True:
+                # Only read the next item when there's a free worker to run it
+                for item in items:
+                    future = executor.submit(with_contextvars(self.run_item), item)
+                    in_flight[future] = self.item_count
+                    self.item_count += 1
+
+                    if len(in_flight) >= self.max_workers:
+                        break
+
+                if not in_flight:
+                    break
+
+                self.peak_in_flight = max(self.peak_in_flight, len(in_flight))
+                done, _ = futures.wait(in_flight, return_when=futures.FIRST_COMPLETED)
+
+                # Keep the output, and let the Pipeline and its tasks be garbage collected
+                for future in done:
+                    outputs[in_flight.pop(future)] = future.result()
+
+        return ListArtifact([outputs[index] for index in range(self.item_count)])
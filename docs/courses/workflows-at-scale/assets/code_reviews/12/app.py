@@ -0,0 +1,83 @@
+from attrs import define
+from dotenv import load_dotenv
+
+# Griptape
+from griptape.drivers import OpenAiChatPromptDriver
+from griptape.tasks import PromptTask, ToolkitTask
+from griptape.tools import PromptSummaryTool, WebScraperTool
+
+from resilience import ActivityTimeoutMixin, HedgedPromptDriver, ResilientWorkflow
+
+load_dotenv()
+
+
+# A web scraper that gives up on pages that take longer than activity_timeout seconds
+@define
+class TimeoutWebScraperTool(ActivityTimeoutMixin, WebScraperTool):
+    pass
+
+
+# Send a second request for any prompt that takes longer than 10 seconds
+prompt_driver = HedgedPromptDriver(prompt_driver=OpenAiChatPromptDriver(model="gpt-4o"), hedge_after=10)
+
+# Create the workflow object, giving each summary two minutes to finish
+workflow = ResilientWorkflow(timeouts={"SUMMARY": 120}, fail_fast=False)
+
+# Create tasks
+start_task = PromptTask("I will provide you a list of movies to compare.", prompt_driver=prompt_driver, id="START")
+end_task = PromptTask(
+    """
+    How are these movies the same:
+     {% for value in parent_outputs.values() %}
+     {{ value }}
+     {% endfor %}
+    """,
+    prompt_driver=prompt_driver,
+    id="END",
+)
+
+# Create a list of movie descriptions
+movie_descriptions = [
+    "A boy discovers an alien in his back yard",
+    "A shark attacks a beach",
+    "A princess and a man named Wesley",
+]
+
+# Add tasks to workflow
+workflow.add_task(start_task)
+workflow.add_task(end_task)
+
+# Iterate through the movie descriptions
+for description in movie_descriptions:
+    # Create a nice trimmed description for the first 10 characters
+    trimmed_description = description[0:10].strip().replace(" ", "_")
+
+    # Create the tasks and add ids for them
+    movie_task = PromptTask(
+        "What movie title is this? Return only the movie name: {{ description }}",
+        context={"description": description},
+        prompt_driver=prompt_driver,
+        id=f"MOVIE:{trimmed_description}",
+    )
+    summary_task = ToolkitTask(
+        "Use metacritic to get a summary of this movie: {{ parent_outputs.values() | list |last }}",
+        tools=[TimeoutWebScraperTool(activity_timeout=30), PromptSummaryTool(off_prompt=False)],
+        prompt_driver=prompt_driver,
+        id=f"SUMMARY:{trimmed_description}",
+    )
+
+    workflow.insert_tasks(start_task, [movie_task], end_task)
+    workflow.insert_tasks(movie_task, [summary_task], end_task)
+
+# Run the workflow
+workflow.run()
+
+# View the output
+print(workflow.output.value)
+
+# See what the timeouts and hedged requests did
+print(f"Timed out: {workflow.timed_out_task_ids}. Cancelled: {workflow.cancelled_task_ids}.")
+print(
+    f"Hedged {prompt_driver.hedge_count} of {prompt_driver.request_count} prompts. "
+    f"The hedge won {prompt_driver.hedge_win_count} times ({prompt_driver.hedge_win_rate:.0%})."
+)
@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+import concurrent.futures as futures
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Callable, Optional
+
+from attrs import Factory, define, field
+
+# Griptape
+from griptape.artifacts import BaseArtifact, ErrorArtifact
+from griptape.common import observable
+from griptape.drivers import BasePromptDriver
+from griptape.structures import Workflow
+from griptape.tasks import BaseTask
+from griptape.utils import with_contextvars
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from griptape.common import DeltaMessage, Message, PromptStack, ToolAction
+    from griptape.tasks import ActionsSubtask
+
+
+def run_in_daemon_thread(function: Callable, *args) -> futures.Future:
+    """Runs a function in a daemon thread, so a call that never returns can't stop Python from exiting."""
+    future = futures.Future()
+
+    def run() -> None:
+        try:
+            future.set_result(function(*args))
+        except Exception as e:
+            future.set_exception(e)
+
+    threading.Thread(target=with_contextvars(run), daemon=True).start()
+
+    return future
+
+
+@define(slots=False)
+class ActivityTimeoutMixin:
+    """Gives up on a tool activity that takes longer than activity_timeout seconds.
+
+    The LLM gets an ErrorArtifact back, so it can try something else, like a different URL.
+
+    Attributes:
+        activity_timeout: The most seconds a single activity may take. None means no limit.
+    """
+
+    activity_timeout: Optional[float] = field(default=None, kw_only=True)
+
+    def run(self, activity: Callable, subtask: ActionsSubtask, action: ToolAction) -> BaseArtifact:
+        if self.activity_timeout is None:
+            return super().run(activity, subtask, action)  # pyright: ignore[reportAttributeAccessIssue]
+
+        future = run_in_daemon_thread(super().run, activity, subtask, action)  # pyright: ignore[reportAttributeAccessIssue]
+        try:
+            return future.result(timeout=self.activity_timeout)
+        except futures.TimeoutError:
+            return ErrorArtifact(f"{action.name}.{action.path} timed out after {self.activity_timeout} seconds")
+
+
+@define(kw_only=True)
+class HedgedPromptDriver(BasePromptDriver):
+    """A Prompt Driver that sends a second, identical request when the first one is slow.
+
+    Whichever request finishes first wins, and the other one is ignored.
+
+    Attributes:
+        prompt_driver: The Prompt Driver that sends the requests.
+        hedge_after: The seconds to wait for the first request before sending the second one.
+        request_count: The number of prompts run.
+        hedge_count: The number of prompts that needed a second request.
+        hedge_win_count: The number of prompts where the second request finished first.
+    """
+
+    prompt_driver: BasePromptDriver = field()
+    hedge_after: float = field(default=5.0)
+    model: str = field(default=Factory(lambda self: self.prompt_driver.model, takes_self=True))
+    tokenizer: Any = field(default=Factory(lambda self: self.prompt_driver.tokenizer, takes_self=True))
+    use_native_tools: bool = field(default=Factory(lambda self: self.prompt_driver.use_native_tools, takes_self=True))
+    request_count: int = field(default=0)
+    hedge_count: int = field(default=0)
+    hedge_win_count: int = field(default=0)
+    lock: threading.Lock = field(factory=threading.Lock)
+
+    @property
+    def hedge_win_rate(self) -> float:
+        return self.hedge_win_count / self.hedge_count if self.hedge_count else 0.0
+
+    def try_run(self, prompt_stack: PromptStack) -> Message:
+        with self.lock:
+            self.request_count += 1
+
+        first = run_in_daemon_thread(self.prompt_driver.try_run, prompt_stack)
+        done, _ = futures.wait([first], timeout=self.hedge_after)
+        if done:
+            return first.result()
+
+        with self.lock:
+            self.hedge_count += 1
+        hedge = run_in_daemon_thread(self.prompt_driver.try_run, prompt_stack)
+
+        # Take the first request that succeeds, and only fail if both of them do
+        error = None
+        for future in futures.as_completed([first, hedge]):
+            if future.exception() is None:
+                if future is hedge:
+                    with self.lock:
+                        self.hedge_win_count += 1
+                return future.result()
+            error = future.exception()
+
+        raise error  # pyright: ignore[reportGeneralTypeIssues]
+
+    def try_stream(self, prompt_stack: PromptStack) -> Iterator[DeltaMessage]:
+        # A stream has already started printing, so it can't be raced against another one
+        with self.lock:
+            self.request_count += 1
+
+        yield from self.prompt_driver.try_stream(prompt_stack)
+
+
+@define
+class ResilientWorkflow(Workflow):
+    """A Workflow that times out slow tasks and cancels the tasks that depend on failed ones.
+
+    Attributes:
+        timeouts: The most seconds a task may take, by task id or by the part of the id before the ":".
+        default_timeout: The timeout for tasks not in timeouts. None means no limit.
+        propagate_cancellation: Cancel a task instead of running it when all of its parents failed.
+        max_timed_tasks: The most tasks with a timeout that may run at once. Defaults to the futures_executor's
+            max_workers, so tasks with a timeout run as many at a time as the tasks without one.
+        timed_out_task_ids: The ids of the tasks that timed out during the last run.
+        cancelled_task_ids: The ids of the tasks that were cancelled during the last run.
+    """
+
+    timeouts: dict[str, float] = field(factory=dict, kw_only=True)
+    default_timeout: Optional[float] = field(default=None, kw_only=True)
+    propagate_cancellation: bool = field(default=True, kw_only=True)
+    max_timed_tasks: int = field(
+        default=Factory(lambda self: getattr(self.futures_executor, "_max_workers", 32), takes_self=True),
+        kw_only=True,
+    )
+    timed_out_task_ids: list[str] = field(factory=list, init=False)
+    cancelled_task_ids: list[str] = field(factory=list, init=False)
+
+    def timeout_for(self, task: BaseTask) -> Optional[float]:
+        return self.timeouts.get(task.id, self.timeouts.get(task.id.split(":")[0], self.default_timeout))
+
+    def finish_task(self, task: BaseTask, output: ErrorArtifact) -> None:
+        task.output = output
+        task.state = BaseTask.State.FINISHED
+
+    def timeout_error(self, task: BaseTask) -> ErrorArtifact:
+        return ErrorArtifact(f"{task.id} timed out after {self.timeout_for(task)} seconds")
+
+    def should_cancel(self, task: BaseTask) -> bool:
+        parent_outputs = [parent.output for parent in task.parents]
+
+        return bool(parent_outputs) and all(isinstance(output, ErrorArtifact) for output in parent_outputs)
+
+    def run_task(self, task: BaseTask) -> Callable[[], BaseArtifact]:
+        def run() -> BaseArtifact:
+            output = task.run()
+
+            # Python can't stop a thread, so a task that finishes after timing out
+            # would overwrite its timeout error. Put the error back.
+            if task.id in self.timed_out_task_ids:
+                self.finish_task(task, self.timeout_error(task))
+
+            return output
+
+        return with_contextvars(run)
+
+    @observable
+    def try_run(self, *args) -> Workflow:
+        self.timed_out_task_ids.clear()
+        self.cancelled_task_ids.clear()
+        submitted: set[str] = set()
+        running: dict[futures.Future, tuple[BaseTask, Optional[float]]] = {}
+
+        while True:
+            timed_task_count = sum(deadline is not None for _, deadline in running.values())
+
+            # The tasks are in topological order, so a cancellation reaches every task downstream in one pass
+            for task in self.order_tasks():
+                if task.id in submitted or not task.can_run():
+                    continue
+
+                if self.propagate_cancellation and self.should_cancel(task):
+                    submitted.add(task.id)
+                    self.finish_task(task, ErrorArtifact(f"{task.id} was cancelled because all of its parents failed"))
+                    self.cancelled_task_ids.append(task.id)
+                    continue
+
+                # Tasks with a timeout don't go through the thread pool, so limit them here.
+                # The rest wait for a running one to finish or time out.
+                timeout = self.timeout_for(task)
+                if timeout is not None and timed_task_count >= self.max_timed_tasks:
+                    continue
+
+                submitted.add(task.id)
+                if timeout is None:
+                    running[self.futures_executor.submit(self.run_task(task))] = (task, None)
+                else:
+                    # A task that can time out gets a daemon thread, so if it hangs it can't stop Python from exiting
+                    running[run_in_daemon_thread(self.run_task(task))] = (task, time.monotonic() + timeout)
+                    timed_task_count += 1
+
+            if not running:
+                return self
+
+            # Wake up when a task finishes, or when the next deadline passes
+            deadlines = [deadline for _, deadline in running.values() if deadline is not None]
+            wait_timeout = max(0.0, min(deadlines) - time.monotonic()) if deadlines else None
+            done, _ = futures.wait(running, timeout=wait_timeout, return_when=futures.FIRST_COMPLETED)
+
+            for future in done:
+                task, _ = running.pop(future)
+
+                if isinstance(task.output, ErrorArtifact) and self.fail_fast:
+                    return self
+
+            for future, (task, deadline) in list(running.items()):
+                if deadline is not None and time.monotonic() >= deadline and not future.done():
+                    running.pop(future)
+                    self.timed_out_task_ids.append(task.id)
+                    self.finish_task(task, self.timeout_error(task))
+
+                    if self.fail_fast:
+                        return self
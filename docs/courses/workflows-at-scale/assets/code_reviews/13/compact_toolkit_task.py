@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from attrs import define, field
+
+# Griptape
+from griptape.artifacts import ErrorArtifact, InfoArtifact, ListArtifact
+from griptape.chunkers import TextChunker
+from griptape.tasks import ToolkitTask
+
+if TYPE_CHECKING:
+    from griptape.artifacts import BaseArtifact
+    from griptape.common import PromptStack
+    from griptape.tasks import ActionsSubtask
+
+
+@define
+class CompactToolkitTask(ToolkitTask):
+    """A ToolkitTask that shortens the tool outputs of older subtasks before they're sent again.
+
+    Every time a ToolkitTask asks the LLM for its next step, it sends every earlier step along
+    with it. Long tool outputs are replaced with a short digest, and the full output is stored
+    in Task Memory so that tools like PromptSummaryTool can still read it.
+
+    Attributes:
+        keep_recent_subtasks: The number of most recent subtasks whose outputs are sent in full.
+        max_observation_tokens: The most tokens an older tool output is shortened to.
+        compacted_token_count: The number of tokens removed from the prompt during the last run.
+    """
+
+    keep_recent_subtasks: int = field(default=1, kw_only=True)
+    max_observation_tokens: int = field(default=200, kw_only=True)
+    compacted_token_count: int = field(default=0, init=False)
+    compacted_subtask_ids: set[str] = field(factory=set, init=False)
+
+    def try_run(self) -> BaseArtifact:
+        self.compacted_token_count = 0
+        self.compacted_subtask_ids.clear()
+
+        return super().try_run()
+
+    @property
+    def prompt_stack(self) -> PromptStack:
+        # The prompt is built before every step, so shorten the outputs that have fallen behind
+        finished_subtasks = [subtask for subtask in self.subtasks if subtask.output is not None]
+        older_subtasks = finished_subtasks[: max(0, len(finished_subtasks) - self.keep_recent_subtasks)]
+
+        for subtask in older_subtasks:
+            if subtask.id not in self.compacted_subtask_ids:
+                self.compact_subtask(subtask)
+                self.compacted_subtask_ids.add(subtask.id)
+
+        return super().prompt_stack
+
+    def compact_subtask(self, subtask: ActionsSubtask) -> None:
+        for action in subtask.actions:
+            if action.output is not None:
+                action.output = self.compact_artifact(action.output, f"{subtask.id}-{action.tag}")
+
+        # Without native tool calling, the prompt shows the subtask's output rather than each action's
+        if isinstance(subtask.output, ListArtifact) and subtask.actions:
+            subtask.output = ListArtifact([action.output for action in subtask.actions if action.output is not None])
+
+    def compact_artifact(self, artifact: BaseArtifact, namespace: str) -> BaseArtifact:
+        # Memory references and errors are already short, and the LLM needs to see errors in full
+        if isinstance(artifact, (InfoArtifact, ErrorArtifact)):
+            return artifact
+
+        tokenizer = self.prompt_driver.tokenizer
+        text = artifact.to_text()
+        token_count = tokenizer.count_tokens(text)
+        if token_count <= self.max_observation_tokens:
+            return artifact
+
+        digest = TextChunker(tokenizer=tokenizer, max_tokens=self.max_observation_tokens).chunk(text)[0].value
+        self.compacted_token_count += token_count - tokenizer.count_tokens(digest)
+
+        if self.task_memory is None or self.task_memory.store_artifact(namespace, artifact) is not None:
+            return InfoArtifact(f"{digest}\n[Shortened from {token_count} tokens]", name=namespace)
+
+        return InfoArtifact(
+            f"{digest}\n[Shortened from {token_count} tokens. The full output was stored in memory with "
+            f'memory_name "{self.task_memory.name}" and artifact_namespace "{namespace}"]',
+            name=namespace,
+        )
@@ -0,0 +1,3 @@
+from .tool import StreamingWebScraperTool
+
+__all__ = ["StreamingWebScraperTool"]
@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import codecs
+import concurrent.futures as futures
+import queue
+import re
+import time
+from html.parser import HTMLParser
+from typing import TYPE_CHECKING
+
+import requests
+from attrs import Factory, define, field
+from schema import Literal, Schema
+
+# Griptape
+from griptape.artifacts import ErrorArtifact, TextArtifact
+from griptape.engines import PromptSummaryEngine
+from griptape.tools import BaseTool
+from griptape.utils import with_contextvars
+from griptape.utils.decorators import activity
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+class TextExtractor(HTMLParser):
+    """Turns HTML into plain text as it's fed in, skipping scripts, styles and other non-content tags."""
+
+    SKIPPED_TAGS = {"script", "style", "noscript", "svg", "head", "nav", "footer", "form"}
+    BLOCK_TAGS = {"p", "div", "br", "li", "tr", "section", "article", "h1", "h2", "h3", "h4", "h5", "h6"}
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.skip_depth = 0
+        self.parts = []
+
+    def handle_starttag(self, tag: str, attrs: list) -> None:
+        if tag in self.SKIPPED_TAGS:
+            self.skip_depth += 1
+        elif tag in self.BLOCK_TAGS:
+            self.parts.append("\n")
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag in self.SKIPPED_TAGS:
+            self.skip_depth = max(0, self.skip_depth - 1)
+        elif tag in self.BLOCK_TAGS:
+            self.parts.append("\n")
+
+    def handle_data(self, data: str) -> None:
+        if self.skip_depth == 0:
+            self.parts.append(data)
+
+    def take_text(self) -> str:
+        """Returns the text found since the last call, with the whitespace tidied up."""
+        text = "".join(self.parts)
+        self.parts.clear()
+        text = re.sub(r"[ \t\r\f\v]+", " ", text)
+
+        return re.sub(r"\s*\n\s*", "\n", text)
+
+
+@define
+class StreamingWebScraperTool(BaseTool):
+    """A web scraper that reads pages as they download, and stops as soon as it has enough.
+
+    Attributes:
+        max_bytes: The most bytes to download from a page.
+        max_seconds: The most seconds to spend downloading a page.
+        max_tokens: The most tokens of text to extract from a page.
+        chunk_tokens: The size of the chunks that are summarized while the rest of the page downloads.
+        request_timeout: Seconds to wait for the server to respond, or to send the next bytes.
+        prompt_summary_engine: The engine used to summarize pages.
+    """
+
+    max_bytes: int = field(default=2_000_000, kw_only=True)
+    max_seconds: float = field(default=10.0, kw_only=True)
+    max_tokens: int = field(default=8000, kw_only=True)
+    chunk_tokens: int = field(default=2000, kw_only=True)
+    request_timeout: float = field(default=10.0, kw_only=True)
+    prompt_summary_engine: PromptSummaryEngine = field(default=Factory(lambda: PromptSummaryEngine()), kw_only=True)
+
+    def stream_text(self, url: str) -> Iterator[str]:
+        """Yields the text of a page as it downloads, until the page ends or a limit is reached."""
+        start_time = time.monotonic()
+        extractor = TextExtractor()
+        byte_count = 0
+
+        with requests.get(url, stream=True, timeout=self.request_timeout) as response:
+            response.raise_for_status()
+            # Without a charset, requests assumes ISO-8859-1 for text, but nearly every page is UTF-8.
+            # apparent_encoding would have to download the whole page to guess, so use UTF-8 instead.
+            has_charset = "charset=" in response.headers.get("content-type", "").lower()
+            encoding = response.encoding if has_charset and response.encoding else "utf-8"
+            decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+
+            for data in response.iter_content(chunk_size=4096):
+                byte_count += len(data)
+                extractor.feed(decoder.decode(data))
+
+                text = extractor.take_text()
+                if text.strip():
+                    yield text
+
+                if byte_count >= self.max_bytes or time.monotonic() - start_time >= self.max_seconds:
+                    return
+
+    def stream_chunks(self, url: str) -> Iterator[str]:
+        """Groups the streamed text into chunks of about chunk_tokens, stopping at max_tokens."""
+        tokenizer = self.prompt_summary_engine.prompt_driver.tokenizer
+        chunk = ""
+        total_tokens = 0
+
+        for text in self.stream_text(url):
+            chunk += text
+            chunk_tokens = tokenizer.count_tokens(chunk)
+
+            if chunk_tokens >= self.chunk_tokens or total_tokens + chunk_tokens >= self.max_tokens:
+                yield chunk.strip()
+                total_tokens += chunk_tokens
+                chunk = ""
+
+                if total_tokens >= self.max_tokens:
+                    return
+
+        if chunk.strip():
+            yield chunk.strip()
+
+    @activity(
+        config={
+            "description": "Can be used to browse a web page and load the start of its content",
+            "schema": Schema({Literal("url", description="Valid HTTP URL"): str}),
+        },
+    )
+    def get_content(self, params: dict) -> TextArtifact | ErrorArtifact:
+        url = params["values"]["url"]
+
+        try:
+            return TextArtifact("\n".join(self.stream_chunks(url)))
+        except Exception as e:
+            return ErrorArtifact("Error getting page content: " + str(e))
+
+    @activity(
+        config={
+            "description": "Can be used to browse a web page and summarize its content",
+            "schema": Schema({Literal("url", description="Valid HTTP URL"): str}),
+        },
+    )
+    def get_summary(self, params: dict) -> TextArtifact | ErrorArtifact:
+        url = params["values"]["url"]
+        chunks = queue.Queue()
+
+        def download() -> None:
+            try:
+                for chunk in self.stream_chunks(url):
+                    chunks.put(chunk)
+            finally:
+                chunks.put(None)
+
+        # Download in the background, so the first chunk is summarized while the rest arrive
+        with futures.ThreadPoolExecutor(max_workers=1) as executor:
+            download_future = executor.submit(with_contextvars(download))
+            summary = ""
+
+            while (chunk := chunks.get()) is not None:
+                summary = self.prompt_summary_engine.summarize_text(f"{summary}\n\n{chunk}".strip())
+
+            try:
+                download_future.result()
+            except Exception as e:
+                if not summary:
+                    return ErrorArtifact("Error getting page content: " + str(e))
+
+        return TextArtifact(summary)
@@ -0,0 +1,42 @@
+import time
+
+# Griptape
+from griptape.structures import Workflow
+from griptape.tasks import CodeExecutionTask
+
+from image_functions import count_colors, create_poster, stylize_poster
+from process_backend import ProcessTask, ProcessWorkflow
+
+movie_titles = ["E.T.", "Jaws", "The Princess Bride", "Alien", "Up", "Heat", "Big", "Rocky"]
+
+
+def create_workflow(workflow: Workflow) -> Workflow:
+    # Collect the stylized posters, and count their colors
+    end_task = ProcessTask(process_fn=count_colors, id="END")
+    workflow.add_task(end_task)
+
+    for title in movie_titles:
+        title_task = CodeExecutionTask(title, on_run=lambda task: task.input, id=f"TITLE:{title}")
+        poster_task = ProcessTask(process_fn=create_poster, id=f"POSTER:{title}")
+        style_task = ProcessTask(process_fn=stylize_poster, id=f"STYLE:{title}")
+
+        workflow.add_task(title_task)
+        workflow.insert_tasks(title_task, [poster_task], end_task)
+        workflow.insert_tasks(poster_task, [style_task], end_task)
+
+    return workflow
+
+
+def main() -> None:
+    # Run the same Workflow with threads, and then with processes
+    for workflow in [Workflow(), ProcessWorkflow()]:
+        start_time = time.perf_counter()
+        create_workflow(workflow).run()
+
+        print(workflow.output.value)
+        print(f"{workflow.__class__.__name__} took {time.perf_counter() - start_time:.2f} seconds\n")
+
+
+# Worker processes import this file too, so only run the Workflows in the main process
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+import io
+
+from PIL import Image, ImageFilter, ImageOps
+
+# Griptape
+from griptape.artifacts import BaseArtifact, ImageArtifact, TextArtifact
+
+
+def create_poster(inputs: list[BaseArtifact]) -> ImageArtifact:
+    # Create a large, noisy image for a movie poster. Stands in for a generated image.
+    title = inputs[0].to_text()
+    image = Image.effect_noise((1000, 1000), 20 + len(title) % 40).convert("RGB")
+
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG")
+
+    return ImageArtifact(buffer.getvalue(), format="png", width=image.width, height=image.height, name=title)
+
+
+def stylize_poster(inputs: list[BaseArtifact]) -> ImageArtifact:
+    # Blur, posterize and shrink the poster. All of this keeps the CPU busy.
+    poster = inputs[0]
+    image = Image.open(io.BytesIO(poster.value))
+    image = image.filter(ImageFilter.GaussianBlur(8))
+    image = ImageOps.posterize(image, 3)
+    image.thumbnail((500, 500))
+
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG")
+
+    return ImageArtifact(buffer.getvalue(), format="png", width=image.width, height=image.height, name=poster.name)
+
+
+def count_colors(inputs: list[BaseArtifact]) -> TextArtifact:
+    # Count the colors used in each poster
+    lines = []
+    for poster in inputs:
+        image = Image.open(io.BytesIO(poster.value))
+        lines.append(f"{poster.name}: {len(image.getcolors(maxcolors=image.width * image.height) or [])} colors")
+
+    return TextArtifact("\n".join(lines))
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import concurrent.futures as futures
+import multiprocessing
+from multiprocessing import shared_memory
+from typing import Any, Callable, Optional
+
+from attrs import define, field
+
+# Griptape
+from griptape.artifacts import BaseArtifact, ImageArtifact, ListArtifact
+from griptape.structures import Workflow
+from griptape.tasks import BaseTask
+
+
+@define
+class SharedImage:
+    """A small, picklable handle to an ImageArtifact whose bytes live in shared memory.
+
+    Attributes:
+        memory_name: The name of the shared memory block holding the image bytes.
+        size: The number of bytes in the image.
+    """
+
+    memory_name: str = field(kw_only=True)
+    size: int = field(kw_only=True)
+    format: str = field(kw_only=True)
+    width: int = field(kw_only=True)
+    height: int = field(kw_only=True)
+    name: str = field(kw_only=True)
+    meta: dict = field(factory=dict, kw_only=True)
+
+
+def share_artifact(artifact: BaseArtifact, memory_blocks: list[shared_memory.SharedMemory]) -> Any:
+    """Copies image bytes into shared memory and returns a handle. Other artifacts are returned as they are."""
+    if isinstance(artifact, ListArtifact):
+        return [share_artifact(item, memory_blocks) for item in artifact.value]
+    if not isinstance(artifact, ImageArtifact):
+        return artifact
+
+    memory = shared_memory.SharedMemory(create=True, size=max(1, len(artifact.value)))
+    memory.buf[: len(artifact.value)] = artifact.value  # pyright: ignore[reportOptionalSubscript]
+    memory_blocks.append(memory)
+
+    return SharedImage(
+        memory_name=memory.name,
+        size=len(artifact.value),
+        format=artifact.format,
+        width=artifact.width,
+        height=artifact.height,
+        name=artifact.name,
+        meta=artifact.meta,
+    )
+
+
+def load_artifact(value: Any, *, unlink: bool = False) -> BaseArtifact:
+    """Turns a value from share_artifact back into an artifact, reading image bytes from shared memory."""
+    if isinstance(value, list):
+        return ListArtifact([load_artifact(item, unlink=unlink) for item in value])
+    if not isinstance(value, SharedImage):
+        return value
+
+    memory = shared_memory.SharedMemory(name=value.memory_name)
+    try:
+        image_bytes = bytes(memory.buf[: value.size])  # pyright: ignore[reportOptionalSubscript]
+    finally:
+        memory.close()
+        if unlink:
+            memory.unlink()
+
+    return ImageArtifact(
+        image_bytes, format=value.format, width=value.width, height=value.height, name=value.name, meta=value.meta
+    )
+
+
+def run_in_process(process_fn: Callable[[list[BaseArtifact]], BaseArtifact], shared_inputs: list) -> Any:
+    """Runs in a worker process. Loads the inputs, runs the function, and shares the output."""
+    inputs = [load_artifact(value) for value in shared_inputs]
+    output_blocks = []
+    shared_output = share_artifact(process_fn(inputs), output_blocks)
+
+    # Close this process's handle only. The parent unlinks the memory once it has read it.
+    for memory in output_blocks:
+        memory.close()
+
+    return shared_output
+
+
+@define
+class ProcessTask(BaseTask):
+    """A task that runs a function in a separate process, with its parents' outputs as the input.
+
+    Image bytes are passed to and from the process through shared memory rather than being pickled.
+    When the task isn't part of a ProcessWorkflow, the function runs in the current process instead.
+
+    Attributes:
+        process_fn: The function to run. It must be defined at the top level of a module, so it can be pickled.
+    """
+
+    process_fn: Callable[[list[BaseArtifact]], BaseArtifact] = field(kw_only=True)
+
+    @property
+    def input(self) -> ListArtifact:
+        return ListArtifact(list(self.parent_outputs.values()))
+
+    def try_run(self) -> BaseArtifact:
+        process_executor = getattr(self.structure, "process_executor", None)
+        if process_executor is None:
+            return self.process_fn(list(self.input.value))
+
+        input_blocks = []
+        try:
+            shared_inputs = [share_artifact(artifact, input_blocks) for artifact in self.input.value]
+            shared_output = process_executor.submit(run_in_process, self.process_fn, shared_inputs).result()
+
+            return load_artifact(shared_output, unlink=True)
+        finally:
+            for memory in input_blocks:
+                memory.close()
+                memory.unlink()
+
+
+@define
+class ProcessWorkflow(Workflow):
+    """A Workflow with a pool of worker processes for its ProcessTasks to run in.
+
+    Every other task still runs in a thread, exactly like a regular Workflow.
+
+    Attributes:
+        max_processes: The number of worker processes. Defaults to the number of CPUs.
+        process_executor: The pool of worker processes. Only set while the Workflow is running.
+    """
+
+    max_processes: Optional[int] = field(default=None, kw_only=True)
+    process_executor: Optional[futures.Executor] = field(default=None, init=False)
+
+    def try_run(self, *args) -> Workflow:
+        # A pool for every run, shut down when the run ends so no worker processes are left behind.
+        # "spawn" starts each worker fresh, which is safe even though the Workflow is using threads.
+        with futures.ProcessPoolExecutor(
+            max_workers=self.max_processes, mp_context=multiprocessing.get_context("spawn")
+        ) as process_executor:
+            self.process_executor = process_executor
+            try:
+                return super().try_run(*args)
+            finally:
+                self.process_executor = None
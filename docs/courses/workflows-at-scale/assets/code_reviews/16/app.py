@@ -0,0 +1,43 @@
+import os
+import threading
+
+from dotenv import load_dotenv
+
+# Griptape
+from griptape.structures import Workflow
+
+from distributed import DistributedWorkflow, ListTaskQueue, LocalBroker, Worker
+from movies import create_workflow
+
+load_dotenv()
+
+# Use a real Redis server if there is one, otherwise a local stand-in with Workers in threads
+if os.environ.get("REDIS_URL"):
+    import redis  # pyright: ignore[reportMissingImports]
+
+    task_queue = ListTaskQueue(client=redis.Redis.from_url(os.environ["REDIS_URL"]))
+    workers = []
+else:
+    task_queue = ListTaskQueue(client=LocalBroker())
+    workers = [Worker(task_queue=task_queue, create_workflow=lambda: create_workflow(Workflow())) for _ in range(3)]
+
+for worker in workers:
+    threading.Thread(target=worker.run_forever, daemon=True).start()
+
+# Create the workflow, which sends its tasks to the Workers instead of running them
+workflow = DistributedWorkflow(task_queue=task_queue, job_timeout=120)
+create_workflow(workflow)
+
+# Run the workflow
+workflow.run()
+
+# View the output
+print(workflow.output.value)
+
+# See which Worker ran each task
+for task_id, worker_name in workflow.task_workers.items():
+    print(f"{task_id}: {worker_name}")
+print(f"Retried: {workflow.retried_task_ids}")
+
+for worker in workers:
+    worker.stop()
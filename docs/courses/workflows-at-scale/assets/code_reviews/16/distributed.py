@@ -0,0 +1,291 @@
+from __future__ import annotations
+
+import json
+import os
+import socket
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from collections import defaultdict, deque
+from typing import Any, Callable, Optional
+
+from attrs import Factory, define, field
+
+# Griptape
+from griptape.artifacts import BaseArtifact, ErrorArtifact
+from griptape.common import observable
+from griptape.structures import Structure, Workflow
+from griptape.tasks import BaseTask
+
+
+class LocalBroker:
+    """An in-process stand-in for a Redis server, with just the commands the queue needs."""
+
+    def __init__(self) -> None:
+        self.lists = defaultdict(deque)
+        self.expires_at: dict[str, float] = {}
+        self.condition = threading.Condition()
+
+    def drop_expired(self) -> None:
+        now = time.monotonic()
+        for key in [key for key, expires_at in self.expires_at.items() if expires_at <= now]:
+            self.lists.pop(key, None)
+            del self.expires_at[key]
+
+    def lpush(self, key: str, *values: str) -> int:
+        with self.condition:
+            self.drop_expired()
+            for value in values:
+                self.lists[key].appendleft(value)
+            self.condition.notify_all()
+
+            return len(self.lists[key])
+
+    def brpop(self, keys: str | list[str], timeout: float = 0) -> Optional[tuple[str, str]]:
+        keys = [keys] if isinstance(keys, str) else keys
+        deadline = time.monotonic() + timeout
+
+        with self.condition:
+            while True:
+                self.drop_expired()
+                for key in keys:
+                    if self.lists[key]:
+                        return key, self.lists[key].pop()
+
+                # Like Redis, a timeout of 0 means wait forever
+                remaining = deadline - time.monotonic()
+                if timeout and remaining <= 0:
+                    return None
+                self.condition.wait(remaining if timeout else None)
+
+    def expire(self, key: str, seconds: int) -> bool:
+        with self.condition:
+            if not self.lists.get(key):
+                return False
+
+            self.expires_at[key] = time.monotonic() + seconds
+            return True
+
+    def delete(self, *keys: str) -> int:
+        with self.condition:
+            for key in keys:
+                self.expires_at.pop(key, None)
+
+            return sum(bool(self.lists.pop(key, None)) for key in keys)
+
+
+@define
+class BaseTaskQueue(ABC):
+    """Carries jobs from a DistributedWorkflow to its Workers, and results back again."""
+
+    @abstractmethod
+    def put_job(self, job: dict) -> None: ...
+
+    @abstractmethod
+    def get_job(self, timeout: float) -> Optional[dict]: ...
+
+    @abstractmethod
+    def put_result(self, reply_to: str, result: dict) -> None: ...
+
+    @abstractmethod
+    def get_result(self, reply_to: str, timeout: float) -> Optional[dict]: ...
+
+    @abstractmethod
+    def clear_results(self, reply_to: str) -> None: ...
+
+
+@define
+class ListTaskQueue(BaseTaskQueue):
+    """A task queue built on Redis lists. Works with a `redis.Redis` client, or a LocalBroker for testing.
+
+    Attributes:
+        client: A Redis client, or anything else with Redis' `lpush`, `brpop`, `expire` and `delete` commands.
+        name: A prefix for the keys the queue uses.
+        result_ttl: Seconds to keep a results list after its last result, in case no one clears it.
+    """
+
+    client: Any = field(kw_only=True)
+    name: str = field(default="workflow", kw_only=True)
+    result_ttl: int = field(default=3600, kw_only=True)
+
+    @property
+    def jobs_key(self) -> str:
+        return f"{self.name}:jobs"
+
+    def results_key(self, reply_to: str) -> str:
+        return f"{self.name}:{reply_to}"
+
+    def pop(self, key: str, timeout: float) -> Optional[dict]:
+        # A timeout of 0 means wait forever, so never pass 0
+        item = self.client.brpop([key], timeout=max(timeout, 0.01))
+        if item is None:
+            return None
+
+        value = item[1]
+        return json.loads(value.decode() if isinstance(value, bytes) else value)
+
+    def put_job(self, job: dict) -> None:
+        self.client.lpush(self.jobs_key, json.dumps(job))
+
+    def get_job(self, timeout: float) -> Optional[dict]:
+        return self.pop(self.jobs_key, timeout)
+
+    def put_result(self, reply_to: str, result: dict) -> None:
+        # A result that arrives after the Workflow has finished is never read, so let Redis delete it eventually
+        self.client.lpush(self.results_key(reply_to), json.dumps(result))
+        self.client.expire(self.results_key(reply_to), self.result_ttl)
+
+    def get_result(self, reply_to: str, timeout: float) -> Optional[dict]:
+        return self.pop(self.results_key(reply_to), timeout)
+
+    def clear_results(self, reply_to: str) -> None:
+        self.client.delete(self.results_key(reply_to))
+
+
+@define
+class Worker:
+    """Takes jobs from a task queue, runs them, and sends back the results.
+
+    Tasks can't be sent over a queue, so every Worker builds its own copy of the Workflow
+    with create_workflow, and runs the task with the id named in the job.
+
+    Attributes:
+        task_queue: The queue to take jobs from.
+        create_workflow: Builds the Workflow. Must create the same tasks, with the same ids, as the DistributedWorkflow.
+        name: A name for this Worker, included in its results.
+        poll_seconds: How long to wait for a job before checking whether the Worker has been stopped.
+    """
+
+    task_queue: BaseTaskQueue = field(kw_only=True)
+    create_workflow: Callable[[], Structure] = field(kw_only=True)
+    name: str = field(
+        default=Factory(lambda: f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:6]}"), kw_only=True
+    )
+    poll_seconds: float = field(default=1.0, kw_only=True)
+    workflow: Optional[Structure] = field(default=None, kw_only=True)
+    stopped: threading.Event = field(factory=threading.Event, kw_only=True)
+
+    def run_job(self, job: dict) -> dict:
+        if self.workflow is None:
+            self.workflow = self.create_workflow()
+
+        try:
+            task = self.workflow.find_task(job["task_id"])
+            task.reset()
+
+            # Give the parents the outputs they had on the DistributedWorkflow, so the input renders the same way
+            for parent in task.parents:
+                parent.output = None
+            for parent_id, output_json in job["parent_outputs"].items():
+                self.workflow.find_task(parent_id).output = BaseArtifact.from_json(output_json)
+
+            output = task.run()
+        except Exception as e:
+            output = ErrorArtifact(f"{self.name} couldn't run {job['task_id']}: {e}")
+
+        return {"job_id": job["job_id"], "task_id": job["task_id"], "worker": self.name, "output": output.to_json()}
+
+    def run_forever(self) -> None:
+        while not self.stopped.is_set():
+            job = self.task_queue.get_job(timeout=self.poll_seconds)
+
+            if job is not None:
+                self.task_queue.put_result(job["reply_to"], self.run_job(job))
+
+    def stop(self) -> None:
+        self.stopped.set()
+
+
+@define
+class DistributedWorkflow(Workflow):
+    """A Workflow that sends its ready tasks to Workers through a task queue, instead of running them itself.
+
+    Attributes:
+        task_queue: The queue shared with the Workers.
+        job_timeout: Seconds to wait for a result before assuming the Worker died, and sending the job again.
+        max_retries: The most times a job is sent again, after a timeout or an ErrorArtifact.
+        poll_seconds: The longest to wait for a result before checking for timed out jobs.
+        retried_task_ids: The ids of the tasks that were retried during the last run, once per retry.
+        task_workers: The name of the Worker that ran each task during the last run.
+    """
+
+    task_queue: BaseTaskQueue = field(kw_only=True)
+    job_timeout: float = field(default=300.0, kw_only=True)
+    max_retries: int = field(default=2, kw_only=True)
+    poll_seconds: float = field(default=1.0, kw_only=True)
+    retried_task_ids: list[str] = field(factory=list, init=False)
+    task_workers: dict[str, str] = field(factory=dict, init=False)
+
+    def send_job(self, task: BaseTask, reply_to: str, attempt: int) -> dict:
+        job = {
+            "job_id": f"{reply_to}:{task.id}:{attempt}",
+            "task_id": task.id,
+            "attempt": attempt,
+            "reply_to": reply_to,
+            "parent_outputs": {parent.id: parent.output.to_json() for parent in task.parents if parent.output},
+        }
+        self.task_queue.put_job(job)
+
+        return {"job_id": job["job_id"], "attempt": attempt, "deadline": time.monotonic() + self.job_timeout}
+
+    def finish_task(self, task: BaseTask, output: BaseArtifact) -> None:
+        task.output = output
+        task.state = BaseTask.State.FINISHED
+
+    @observable
+    def try_run(self, *args) -> Workflow:
+        reply_to = f"results:{uuid.uuid4().hex}"
+        self.retried_task_ids.clear()
+        self.task_workers.clear()
+        sent: set[str] = set()
+        pending: dict[str, dict] = {}
+
+        try:
+            while True:
+                for task in self.order_tasks():
+                    if task.id not in sent and task.can_run():
+                        pending[task.id] = self.send_job(task, reply_to, attempt=0)
+                        sent.add(task.id)
+
+                if not pending:
+                    return self
+
+                result = self.task_queue.get_result(reply_to, timeout=self.poll_seconds)
+
+                # Ignore results from an earlier attempt that turned up late
+                if result is not None and pending.get(result["task_id"], {}).get("job_id") == result["job_id"]:
+                    task = self.find_task(result["task_id"])
+                    output = BaseArtifact.from_json(result["output"])
+                    attempt = pending.pop(task.id)["attempt"]
+
+                    if isinstance(output, ErrorArtifact) and attempt < self.max_retries:
+                        pending[task.id] = self.send_job(task, reply_to, attempt + 1)
+                        self.retried_task_ids.append(task.id)
+                    else:
+                        self.finish_task(task, output)
+                        self.task_workers[task.id] = result["worker"]
+
+                        if isinstance(output, ErrorArtifact) and self.fail_fast:
+                            return self
+
+                # A job that's taken too long probably belongs to a Worker that died, so send it again
+                for task_id, job in list(pending.items()):
+                    if time.monotonic() < job["deadline"]:
+                        continue
+
+                    task = self.find_task(task_id)
+                    if job["attempt"] < self.max_retries:
+                        pending[task_id] = self.send_job(task, reply_to, job["attempt"] + 1)
+                        self.retried_task_ids.append(task_id)
+                    else:
+                        pending.pop(task_id)
+                        self.finish_task(
+                            task, ErrorArtifact(f"No Worker finished {task_id} after {job['attempt'] + 1} attempts")
+                        )
+
+                        if self.fail_fast:
+                            return self
+        finally:
+            # Results from attempts that were sent again may still be waiting, so delete them with the list
+            self.task_queue.clear_results(reply_to)
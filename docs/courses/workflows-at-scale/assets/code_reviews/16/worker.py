@@ -0,0 +1,23 @@
+import os
+
+from dotenv import load_dotenv
+
+# Griptape
+from griptape.structures import Workflow
+
+from distributed import ListTaskQueue, Worker
+from movies import create_workflow
+
+load_dotenv()
+
+# Run this script on as many machines as you like, all pointing at the same Redis server
+if os.environ.get("REDIS_URL"):
+    import redis  # pyright: ignore[reportMissingImports]
+
+    task_queue = ListTaskQueue(client=redis.Redis.from_url(os.environ["REDIS_URL"]))
+    worker = Worker(task_queue=task_queue, create_workflow=lambda: create_workflow(Workflow()))
+
+    print(f"Worker {worker.name} is waiting for jobs. Press Ctrl+C to stop.")
+    worker.run_forever()
+else:
+    print("Set REDIS_URL to connect this Worker to a Redis server, for example: redis://localhost:6379")
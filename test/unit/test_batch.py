@@ -0,0 +1,28 @@
+import sys
+from pathlib import Path
+
+# Griptape
+from griptape.drivers import DummyImageGenerationDriver, OpenAiChatPromptDriver
+
+sys.path.insert(0, str(Path(__file__).parents[2] / "docs/courses/image-pipelines-at-scale/assets/code_reviews/03"))
+
+from batch import BatchImageGenerator  # noqa: E402
+
+
+def test_failed_prompts_are_not_generated(tmp_path):
+    prompt_driver = OpenAiChatPromptDriver(
+        model="gpt-4o", api_key="test", base_url="http://127.0.0.1:9", max_attempts=1
+    )
+    generator = BatchImageGenerator(
+        image_generation_driver=DummyImageGenerationDriver(),
+        prompt_driver=prompt_driver,
+        output_dir=str(tmp_path),
+        style="watercolor",
+    )
+
+    results = list(generator.run(["a cow", "a barn"]))
+
+    assert [result.topic for result in sorted(results, key=lambda result: result.topic)] == ["a barn", "a cow"]
+    assert all(result.error and result.error.startswith("Couldn't create a prompt") for result in results)
+    assert generator.error_count == 2
+    assert not list(tmp_path.iterdir())
@@ -0,0 +1,40 @@
+import sys
+from pathlib import Path
+
+from PIL import Image
+
+# Griptape
+from griptape.structures import Pipeline
+from griptape.tasks import CodeExecutionTask
+
+sys.path.insert(0, str(Path(__file__).parents[2] / "docs/courses/image-pipelines-at-scale/assets/code_reviews/11"))
+
+from display import display_image  # noqa: E402
+from gallery_index import get_gallery_index  # noqa: E402
+from image_file import ImageFileArtifact  # noqa: E402
+
+
+def test_an_image_displayed_twice_is_in_the_gallery_once_with_its_first_prompt(tmp_path):
+    Image.new("RGB", (64, 64), "white").save(tmp_path / "cow.png")
+
+    def display(prompt: str) -> None:
+        image = ImageFileArtifact(str(tmp_path / "cow.png"), format="png", width=64, height=64, meta={"prompt": prompt})
+        pipeline = Pipeline(
+            tasks=[
+                CodeExecutionTask(on_run=lambda _: image),
+                CodeExecutionTask(
+                    "{{ parent.output.name }}",
+                    context={"output_dir": str(tmp_path), "style": "photo", "headless": True},
+                    on_run=display_image,
+                ),
+            ]
+        )
+        pipeline.run()
+
+    display("A cow")
+    display("A cow in a field")
+
+    gallery = (tmp_path / "gallery.html").read_text(encoding="utf-8")
+    assert gallery.count('<a href="cow.png"') == 1
+    assert 'title="A cow"' in gallery
+    assert get_gallery_index(str(tmp_path)).count() == 1
@@ -0,0 +1,45 @@
+import sys
+import threading
+import time
+from pathlib import Path
+
+# Griptape
+from griptape.artifacts import TextArtifact
+from griptape.structures import Workflow
+from griptape.tasks import CodeExecutionTask
+
+sys.path.insert(0, str(Path(__file__).parents[2] / "docs/courses/workflows-at-scale/assets/code_reviews/16"))
+
+from distributed import DistributedWorkflow, ListTaskQueue, LocalBroker, Worker  # noqa: E402
+
+
+def create_tasks() -> list[CodeExecutionTask]:
+    return [
+        CodeExecutionTask(on_run=lambda _: TextArtifact("start"), id="START"),
+        CodeExecutionTask(on_run=lambda _: TextArtifact("end"), id="END", parent_ids=["START"]),
+    ]
+
+
+def test_results_list_is_deleted_after_the_run():
+    broker = LocalBroker()
+    task_queue = ListTaskQueue(client=broker)
+    worker = Worker(task_queue=task_queue, create_workflow=lambda: Workflow(tasks=create_tasks()), poll_seconds=0.05)
+    threading.Thread(target=worker.run_forever, daemon=True).start()
+
+    workflow = DistributedWorkflow(tasks=create_tasks(), task_queue=task_queue, poll_seconds=0.05)
+    workflow.run()
+    worker.stop()
+
+    assert workflow.output is not None
+    assert workflow.output.value == "end"
+    assert not any(key.startswith("workflow:results:") for key in broker.lists)
+
+
+def test_late_results_expire():
+    broker = LocalBroker()
+    task_queue = ListTaskQueue(client=broker, result_ttl=0)
+
+    task_queue.put_result("results:late", {"job_id": "late"})
+    time.sleep(0.01)
+
+    assert task_queue.get_result("results:late", timeout=0.01) is None
@@ -0,0 +1,57 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parents[2] / "docs/courses/image-pipelines-at-scale/assets/code_reviews/11"))
+
+from gallery_index import GalleryImage, GalleryIndex  # noqa: E402
+
+
+def create_image(path: str, created_at: float, style: str = "photo") -> GalleryImage:
+    return GalleryImage(
+        path=path,
+        prompt=f"A picture of {path}",
+        style=style,
+        model="dall-e-3",
+        width=1024,
+        height=1024,
+        sha256=path,
+        thumbnail_path=f"thumbnails/{path}",
+        created_at=created_at,
+    )
+
+
+def test_newest_pages_through_images_added_at_the_same_time():
+    gallery_index = GalleryIndex(database=":memory:")
+    for path in ["a.png", "b.png", "c.png", "d.png", "e.png"]:
+        gallery_index.add(create_image(path, created_at=1.0))
+
+    paths = []
+    before = None
+    while page := gallery_index.newest(limit=2, before=before):
+        paths.extend(image.path for image in page)
+        before = (page[-1].created_at, page[-1].path)
+
+    assert paths == ["e.png", "d.png", "c.png", "b.png", "a.png"]
+
+
+def test_newest_treats_zero_as_a_cursor():
+    gallery_index = GalleryIndex(database=":memory:")
+    gallery_index.add(create_image("old.png", created_at=0.0))
+    gallery_index.add(create_image("new.png", created_at=1.0, style="sketch"))
+
+    assert [image.path for image in gallery_index.newest(before=(0.0, "old.png"))] == []
+    assert [image.path for image in gallery_index.newest(before=(1.0, "new.png"))] == ["old.png"]
+    assert [image.path for image in gallery_index.newest(style="sketch")] == ["new.png"]
+
+
+def test_adding_an_image_again_keeps_its_first_prompt():
+    gallery_index = GalleryIndex(database=":memory:")
+    gallery_index.add(create_image("cow.png", created_at=1.0))
+
+    duplicate = create_image("cow.png", created_at=2.0, style="sketch")
+    duplicate.prompt = "A cow in a field"
+    gallery_index.add(duplicate)
+
+    image = gallery_index.get("cow.png")
+    assert image is not None
+    assert (image.prompt, image.style, image.created_at) == ("A picture of cow.png", "photo", 1.0)
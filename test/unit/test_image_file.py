@@ -0,0 +1,19 @@
+import sys
+from pathlib import Path
+
+# Griptape
+from griptape.artifacts import BaseArtifact
+
+sys.path.insert(0, str(Path(__file__).parents[2] / "docs/courses/image-pipelines-at-scale/assets/code_reviews/07"))
+
+from image_file import ImageFileArtifact  # noqa: E402
+
+
+def test_image_file_artifact_round_trips_through_json():
+    artifact = ImageFileArtifact("images/a_cow.png", format="png", width=1024, height=1024, meta={"prompt": "a cow"})
+
+    loaded = BaseArtifact.from_json(artifact.to_json())
+
+    assert isinstance(loaded, ImageFileArtifact)
+    assert loaded == artifact
+    assert loaded.name == "a_cow.png"
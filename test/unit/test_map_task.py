@@ -0,0 +1,33 @@
+import sys
+from collections.abc import Iterator
+from pathlib import Path
+
+# Griptape
+from griptape.artifacts import TextArtifact
+from griptape.structures import Pipeline
+from griptape.tasks import CodeExecutionTask
+
+sys.path.insert(0, str(Path(__file__).parents[2] / "docs/courses/workflows-at-scale/assets/code_reviews/11"))
+
+from map_task import MapTask  # noqa: E402
+
+
+def read_items() -> Iterator[str]:
+    yield "a"
+    yield "b"
+    yield "c"
+
+
+def test_generator_items_are_mapped_on_every_run():
+    map_task = MapTask(
+        items_factory=read_items,
+        task_factory=lambda item: [CodeExecutionTask(on_run=lambda _: TextArtifact(item.upper()))],
+        max_workers=2,
+    )
+    pipeline = Pipeline(tasks=[map_task])
+
+    for _ in range(2):
+        pipeline.run()
+
+        assert [artifact.value for artifact in map_task.output.value] == ["A", "B", "C"]
+        assert map_task.item_count == 3
@@ -0,0 +1,24 @@
+import sys
+from pathlib import Path
+
+# Griptape
+from griptape.drivers import OpenAiChatPromptDriver
+from griptape.structures import Pipeline
+
+sys.path.insert(0, str(Path(__file__).parents[2] / "docs/courses/image-pipelines-at-scale/assets/code_reviews/08"))
+
+from prompt_cache import CachedPromptTask, PromptCache  # noqa: E402
+
+
+def test_failed_prompts_are_not_cached(tmp_path):
+    prompt_driver = OpenAiChatPromptDriver(
+        model="gpt-4o", api_key="test", base_url="http://127.0.0.1:9", max_attempts=1
+    )
+    prompt_cache = PromptCache(cache_dir=str(tmp_path))
+    task = CachedPromptTask("Create a prompt for {{ args[0] }}", prompt_cache=prompt_cache, prompt_driver=prompt_driver)
+    pipeline = Pipeline(tasks=[task])
+
+    pipeline.run("a cow")
+
+    assert "Couldn't create a prompt" in task.output.to_text()
+    assert not list(tmp_path.rglob("*.json"))
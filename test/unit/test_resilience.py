@@ -0,0 +1,40 @@
+import sys
+import threading
+import time
+from pathlib import Path
+
+# Griptape
+from griptape.artifacts import TextArtifact
+from griptape.tasks import CodeExecutionTask
+
+sys.path.insert(0, str(Path(__file__).parents[2] / "docs/courses/workflows-at-scale/assets/code_reviews/12"))
+
+from resilience import ResilientWorkflow  # noqa: E402
+
+
+def test_tasks_with_a_timeout_are_limited_to_max_timed_tasks():
+    lock = threading.Lock()
+    running = 0
+    most_running = 0
+
+    def run(task: CodeExecutionTask) -> TextArtifact:
+        nonlocal running, most_running
+        with lock:
+            running += 1
+            most_running = max(most_running, running)
+        time.sleep(0.05)
+        with lock:
+            running -= 1
+
+        return TextArtifact(task.id)
+
+    workflow = ResilientWorkflow(
+        tasks=[CodeExecutionTask(on_run=run, id=f"TASK:{i}") for i in range(20)],
+        timeouts={"TASK": 10},
+        max_timed_tasks=3,
+    )
+    workflow.run()
+
+    assert most_running == 3
+    assert all(task.output.to_text() == task.id for task in workflow.tasks)
+    assert not workflow.timed_out_task_ids
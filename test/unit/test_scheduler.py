@@ -0,0 +1,57 @@
+import json
+import sys
+from pathlib import Path
+
+# Griptape
+from griptape.artifacts import TextArtifact
+from griptape.tasks import CodeExecutionTask
+
+sys.path.insert(0, str(Path(__file__).parents[2] / "docs/courses/workflows-at-scale/assets/code_reviews/03"))
+
+from scheduler import CriticalPathWorkflow  # noqa: E402
+
+
+def test_tasks_run_after_their_parents_on_the_longest_path_first(tmp_path):
+    latency_file = tmp_path / "task_latencies.json"
+    latency_file.write_text(json.dumps({"SHORT": 1.0, "LONG": 5.0}))
+    started = []
+
+    def create_task(task_id: str, parent_ids: list[str]) -> CodeExecutionTask:
+        return CodeExecutionTask(
+            on_run=lambda _: started.append(task_id) or TextArtifact(task_id), id=task_id, parent_ids=parent_ids
+        )
+
+    workflow = CriticalPathWorkflow(
+        tasks=[
+            create_task("START", []),
+            create_task("SHORT", ["START"]),
+            create_task("LONG", ["START"]),
+            create_task("END", ["SHORT", "LONG"]),
+        ],
+        latency_file=str(latency_file),
+        max_workers=1,
+    )
+    workflow.run()
+
+    assert started == ["START", "LONG", "SHORT", "END"]
+    assert all(task.is_finished() for task in workflow.tasks)
+
+
+def test_critical_path_uses_saved_latencies_before_the_workflow_runs(tmp_path):
+    latency_file = tmp_path / "task_latencies.json"
+    latency_file.write_text(json.dumps({"SHORT": 1.0, "LONG": 5.0}))
+
+    def create_task(task_id: str, parent_ids: list[str]) -> CodeExecutionTask:
+        return CodeExecutionTask(on_run=lambda _: TextArtifact(task_id), id=task_id, parent_ids=parent_ids)
+
+    workflow = CriticalPathWorkflow(
+        tasks=[
+            create_task("START", []),
+            create_task("SHORT", ["START"]),
+            create_task("LONG", ["START"]),
+            create_task("END", ["SHORT", "LONG"]),
+        ],
+        latency_file=str(latency_file),
+    )
+
+    assert [task.id for task in workflow.critical_path()] == ["START", "LONG", "END"]
@@ -0,0 +1,33 @@
+import sys
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+# Griptape
+from griptape.artifacts import TextArtifact
+from griptape.structures import Pipeline
+from griptape.tasks import CodeExecutionTask
+
+sys.path.insert(0, str(Path(__file__).parents[2] / "docs/courses/image-pipelines-at-scale/assets/code_reviews/10"))
+
+from streaming import StreamingPipeline  # noqa: E402
+
+
+def create_pipeline() -> Pipeline:
+    return Pipeline(tasks=[CodeExecutionTask(on_run=lambda task: TextArtifact(task.input.value.upper()))])
+
+
+def test_error_reading_inputs_is_raised_by_run():
+    def topics() -> Iterator[str]:
+        yield "a cow"
+        raise RuntimeError("Ran out of topics")
+
+    streaming_pipeline = StreamingPipeline(create_pipeline=create_pipeline)
+    finished = []
+
+    with pytest.raises(RuntimeError, match="Ran out of topics"):
+        for topic, pipeline in streaming_pipeline.run(topics()):
+            finished.append((topic, pipeline.output_task.output.value))
+
+    assert finished == [("a cow", "A COW")]
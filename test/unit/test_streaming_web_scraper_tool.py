@@ -0,0 +1,33 @@
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parents[2] / "docs/courses/workflows-at-scale/assets/code_reviews/14"))
+
+from streaming_web_scraper_tool.tool import StreamingWebScraperTool  # noqa: E402
+
+
+class PageHandler(BaseHTTPRequestHandler):
+    def do_GET(self) -> None:
+        body = "<p>Amélie is a café waitress in Montmartre.</p>".encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+def test_pages_without_a_charset_are_decoded_as_utf_8():
+    server = HTTPServer(("127.0.0.1", 0), PageHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    try:
+        text = "".join(StreamingWebScraperTool().stream_text(f"http://127.0.0.1:{server.server_port}/"))
+    finally:
+        server.shutdown()
+
+    assert text.strip() == "Amélie is a café waitress in Montmartre."
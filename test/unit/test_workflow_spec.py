@@ -0,0 +1,20 @@
+import sys
+from pathlib import Path
+
+# Griptape
+from griptape.tasks import PromptTask
+
+sys.path.insert(0, str(Path(__file__).parents[2] / "docs/courses/workflows-at-scale/assets/code_reviews/07"))
+
+from workflow_spec import CompiledWorkflow  # noqa: E402
+
+
+def test_inserted_tasks_are_indexed():
+    start_task = PromptTask("start", id="A")
+    end_task = PromptTask("end", id="C")
+    workflow = CompiledWorkflow(tasks=[start_task, end_task])
+
+    workflow.insert_tasks(start_task, [PromptTask("middle", id="B")], end_task)
+
+    assert workflow.try_find_task("B") is not None
+    assert [task.id for task in workflow.order_tasks()] == ["A", "B", "C"]